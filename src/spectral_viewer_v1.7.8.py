@@ -38,12 +38,16 @@ import base64
 import csv
 import json
 import os
-import platform
+import sys
 import webbrowser
 import ctypes
 import tempfile
+import itertools
 import threading
+import time
 import warnings
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
@@ -58,12 +62,14 @@ matplotlib.use("TkAgg")
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from matplotlib.path import Path
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba_array
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.ticker import AutoMinorLocator
 from matplotlib import font_manager as _fm, rcParams as _rc
 
-from scipy.signal import savgol_filter, medfilt
-from scipy.ndimage import median_filter
+from scipy.signal import savgol_filter, savgol_coeffs, medfilt
+from scipy.ndimage import median_filter, convolve1d
 
 import spectral  # type: ignore
 
@@ -74,6 +80,45 @@ try:
 except ImportError:
     HAS_REQUESTS = False
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (kernels are only called when HAS_NUMBA)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda f: f
+
+    prange = range
+
+
+def _njit_kernel(func):
+    """
+    njit(parallel=True) with on-disk caching when possible.
+    
+    Caching needs a source file to locate its cache (absent in a PyInstaller
+    onefile build), so fall back to an uncached kernel rather than failing import.
+    """
+    try:
+        return njit(parallel=True, cache=True)(func)
+    except RuntimeError:
+        return njit(parallel=True)(func)
+
+try:
+    import numexpr
+    HAS_NUMEXPR = True
+except ImportError:
+    HAS_NUMEXPR = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Suppress spectral library warnings about parameter name case
 warnings.filterwarnings("ignore", message="Parameters with non-lowercase names")
 
@@ -110,12 +155,15 @@ DELETE_RADIUS_PX: int = 16
 FIG_DPI: int = 100
 SAVE_DPI: int = 150
 
+IS_WINDOWS: bool = sys.platform.startswith("win")
+
 # Save figure sizes (width, height in inches)
 SAVE_FIGSIZE_IMAGE: Tuple[float, float] = (8, 8)  # For Gray/RGB images (square)
 SAVE_FIGSIZE_SPECTRA: Tuple[float, float] = (10, 6)  # For spectra plot (landscape)
 
 PERCENTILE_LOW: int = 2
 PERCENTILE_HIGH: int = 98
+STRETCH_SAMPLE_MAX: int = 1_000_000  # これを超える画素数は間引いてパーセンタイルを推定
 
 TAB10_CYCLE: int = 10
 
@@ -123,11 +171,23 @@ TAB10_CYCLE: int = 10
 SG_POLYORDER: int = 2
 SG_BASE_WIN: int = 51 # 15
 SG_MIN_WIN: int = 3
+SG_DERIV_ORDERS: Dict[str, int] = {"0th": 0, "1st": 1, "2nd": 2}
 
 # Median (denoise) defaults
 MED_BASE_WIN: int = 21 # 7
 MED_MIN_WIN: int = 3
 
+# Polygon stats sketching ("Fast stats")
+SKETCH_THRESHOLD: int = 10_000  # これを超える画素数のポリゴンはサンプルで統計を計算
+SKETCH_SIZE: int = 4096
+
+# Cache limits (LRU)
+PT_CACHE_MAX: int = 4096  # entries
+POLY_CACHE_MAX: int = 512  # entries
+HSI_CACHE_MAX_BYTES: int = 2 * 1024 ** 3  # 参照用キューブの合計サイズ上限
+HSI_CACHE_MAX_ENTRIES: int = 8  # 参照用キューブの個数上限（memmap はサイズに数えないため）
+SOURCE_EXISTS_TTL_S: float = 1.0  # ソースファイル存在確認の結果を使い回す時間
+
 
 # =============================================================================
 # CUSTOM TOOLBAR WITH DIRECTORY CONTROL
@@ -215,7 +275,15 @@ class CustomNavigationToolbar(NavigationToolbar2Tk):
                 original_pos = ax.get_position()
                 fig.set_size_inches(save_size)
                 fig.tight_layout()  # Optimize internal layout
-                fig.savefig(fname, dpi=SAVE_DPI)
+                # 画像ビューのオーバーレイ（blit専用）も保存画像に含める
+                static = ax is not getattr(self.app_instance, 'ax_spec', None)
+                if static:
+                    self.app_instance._set_overlay_static(ax, True)
+                try:
+                    fig.savefig(fname, dpi=SAVE_DPI)
+                finally:
+                    if static:
+                        self.app_instance._set_overlay_static(ax, False)
                 fig.set_size_inches(original_size)
                 ax.set_position(original_pos)
                 self.canvas.draw_idle()
@@ -238,34 +306,572 @@ class CustomNavigationToolbar(NavigationToolbar2Tk):
 
 
 # =============================================================================
-# COORDINATE TRANSFORMATION HELPERS
+# PATH HELPERS
+# =============================================================================
+@lru_cache(maxsize=4096)
+def _normalize_path(p: str) -> str:
+    """
+    normcase(normpath(abspath(p))), memoized and interned.
+    
+    The same few source paths are normalized for every cache key; the app
+    never changes the working directory, so relative results stay valid.
+    Interning lets equal results compare by identity first.
+    """
+    return sys.intern(os.path.normcase(os.path.normpath(os.path.abspath(p))))
+
+
+def _least_rotation(seq: tuple) -> int:
+    """Start index of the lexicographically smallest rotation of seq (Booth, O(n))."""
+    n = len(seq)
+    ss = seq + seq
+    f = [-1] * (2 * n)
+    k = 0
+    for j in range(1, 2 * n):
+        sj = ss[j]
+        i = f[j - k - 1]
+        while i != -1 and sj != ss[k + i + 1]:
+            if sj < ss[k + i + 1]:
+                k = j - i - 1
+            i = f[i]
+        if sj != ss[k + i + 1]:  # i == -1
+            if sj < ss[k]:
+                k = j
+            f[j - k] = -1
+        else:
+            f[j - k] = i + 1
+    return k
+
+
+@lru_cache(maxsize=4096)
+def _canon_verts(V: Tuple[Tuple[int, int], ...]) -> Tuple[Tuple[int, int], ...]:
+    """Smallest rotation of V or of its reverse (start point / orientation independent)."""
+    if len(V) < 3:
+        return V
+    rev = V[::-1]
+    k, r = _least_rotation(V), _least_rotation(rev)
+    return min(V[k:] + V[:k], rev[r:] + rev[:r])
+
+
+# =============================================================================
+# COORDINATE HELPERS
 # =============================================================================
-def flip_x_for_display(x: float, width: int) -> float:
+# 画像は左右反転して表示するが、配列は反転せずに x 軸を反転させる
+# （ax.xaxis.set_inverted(True)）。そのため表示座標 = データ座標。
+def verts_to_display(verts: Sequence[Tuple[int, int]], closed: bool = False) -> np.ndarray:
     """
-    Transform X coordinate from data space to display space (horizontally flipped).
+    Convert polygon vertices to a float32 array for drawing.
     
     Args:
-        x: X coordinate in data space (0 to width-1)
-        width: Image width
+        verts: Vertex list [(x, y), ...] in data space
+        closed: Append the first vertex at the end (closed ring)
     
     Returns:
-        X coordinate in display space
+        (N, 2) float32 array ((N + 1, 2) if closed)
     """
-    return width - 1 - x
+    n = len(verts)
+    arr = np.empty((n + 1 if closed and n else n, 2), dtype=np.float32)
+    if n:
+        arr[:n] = verts
+        if closed:
+            arr[n] = arr[0]
+    return arr
 
 
-def flip_x_from_display(x: float, width: int) -> float:
+def _rings_contain(rings: np.ndarray, x: float, y: float) -> np.ndarray:
     """
-    Transform X coordinate from display space back to data space.
+    Even-odd (PNPOLY) test of point (x, y) against padded closed rings (P, N, 2).
     
-    Args:
-        x: X coordinate in display space
-        width: Image width
+    Uses the same division-free crossing test as matplotlib's point_in_path,
+    so boundary points agree with Path.contains_point. Padding with repeated
+    vertices adds zero-length edges, which never cross.
+    """
+    x0, y0 = rings[:, :-1, 0], rings[:, :-1, 1]
+    x1, y1 = rings[:, 1:, 0], rings[:, 1:, 1]
+    yflag1 = y1 >= y
+    cross = ((y0 >= y) != yflag1) & ((((y1 - y) * (x0 - x1)) >= ((x1 - x) * (y0 - y1))) == yflag1)
+    return np.logical_xor.reduce(cross, axis=1)
+
+
+def _rings_min_dist2(rings: np.ndarray, x: float, y: float) -> np.ndarray:
+    """Squared distance from (x, y) to the nearest edge of each padded closed ring (P, N, 2)."""
+    p1 = rings[:, :-1]
+    v = rings[:, 1:] - p1
+    w = np.array([x, y]) - p1
+    denom = np.einsum("pnk,pnk->pn", v, v)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(denom > 1e-12, np.einsum("pnk,pnk->pn", w, v) / denom, 0.0)
+    np.clip(t, 0.0, 1.0, out=t)
+    d = w - t[..., None] * v
+    return np.einsum("pnk,pnk->pn", d, d).min(axis=1, initial=np.inf)
+
+
+def _interp_columns(x: np.ndarray, xp: np.ndarray, fp: np.ndarray) -> np.ndarray:
+    """
+    np.interp(x, xp, fp[:, k], left=nan, right=nan) for all columns k in one pass.
+    
+    Follows np.interp's arithmetic (exact hits, NaN retry from the right end),
+    so results are bit-identical. Unsorted xp falls back to per-column np.interp.
+    """
+    x = np.asarray(x, dtype=float).reshape(-1)
+    xp = np.asarray(xp, dtype=float).reshape(-1)
+    fp = np.asarray(fp, dtype=float).reshape(xp.size, -1)
+    if xp.size > 1 and np.any(xp[1:] < xp[:-1]):
+        return np.column_stack([np.interp(x, xp, fp[:, k], left=np.nan, right=np.nan)
+                                for k in range(fp.shape[1])]).reshape(x.size, -1)
+    out = np.full((x.size, fp.shape[1]), np.nan)
+    inr = np.flatnonzero((x >= xp[0]) & (x <= xp[-1])) if xp.size else np.empty(0, dtype=np.intp)
+    if inr.size == 0:
+        return out
+    xi = x[inr]
+    j = np.searchsorted(xp, xi, side="right") - 1
+    j0 = np.minimum(j, max(xp.size - 2, 0))
+    j1 = np.minimum(j0 + 1, xp.size - 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y0, y1 = fp[j0], fp[j1]
+        slope = (y1 - y0) / (xp[j1] - xp[j0])[:, None]
+        r = slope * (xi - xp[j0])[:, None] + y0
+        nan = np.isnan(r)
+        if nan.any():
+            r = np.where(nan, slope * (xi - xp[j1])[:, None] + y1, r)
+            r = np.where(np.isnan(r) & (y0 == y1), y0, r)
+    out[inr] = np.where((xp[j] == xi)[:, None], fp[j], r)
+    return out
+
+
+def _gather_pixels(d: np.ndarray, idx: np.ndarray, s: slice = slice(None)) -> np.ndarray:
+    """
+    Spectra d[y, x, s] for flat pixel indices (y * W + x) as an (N, bands) array.
+    
+    Non-contiguous cubes (e.g. BSQ/BIL memmaps) are indexed per pixel instead
+    of reshape(), which would copy the whole cube.
+    """
+    H, W, B = d.shape
+    if d.flags.c_contiguous:
+        return d.reshape(-1, B)[idx, s]
+    y, x = np.divmod(idx, W)
+    return d[y, x, s]
+
+
+# =============================================================================
+# FILTER COEFFICIENTS
+# =============================================================================
+@lru_cache(maxsize=64)
+def _sg_coeffs(win: int, poly: int, deriv: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Savitzky-Golay weights equivalent to savgol_filter(mode="interp").
     
     Returns:
-        X coordinate in data space (0 to width-1)
+        (conv, edge_lo, edge_hi): interior convolution kernel for convolve1d and
+        (win//2, win) dot-product weights for the first / last half-window
+    """
+    half = win // 2
+    conv = savgol_coeffs(win, poly, deriv=deriv)
+    edge = np.array([savgol_coeffs(win, poly, deriv=deriv, pos=i, use="dot") for i in range(win)])
+    return conv, edge[:half].T.copy(), edge[win - half:].T.copy()
+
+
+# =============================================================================
+# CACHE UTILITIES
+# =============================================================================
+class LRUCache(OrderedDict):
+    """
+    Dict with least-recently-used eviction.
+    
+    Capacity is counted in entries, or in getsizeof(value) units when given
+    (e.g. bytes); maxcount optionally caps the entry count as well. The most
+    recent entry is always kept even if it alone exceeds maxsize.
+    on_evict(key, value) is called for entries dropped by the size bound
+    (not for explicit pop / del / clear).
+    """
+    _MISSING = object()
+
+    def __init__(self, maxsize: int, getsizeof=None, maxcount: Optional[int] = None, on_evict=None):
+        super().__init__()
+        self.maxsize = maxsize
+        self.getsizeof = getsizeof
+        self.maxcount = maxcount
+        self.on_evict = on_evict
+        self.currsize = 0
+        self._sizes: Dict[Any, int] = {}
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def __setitem__(self, key, value):
+        if key in self:
+            self.pop(key)
+        size = int(self.getsizeof(value)) if self.getsizeof else 1
+        super().__setitem__(key, value)
+        self._sizes[key] = size
+        self.currsize += size
+        while len(self) > 1 and (self.currsize > self.maxsize
+                                 or (self.maxcount is not None and len(self) > self.maxcount)):
+            k, v = self.popitem(last=False)
+            if self.on_evict is not None:
+                self.on_evict(k, v)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.currsize -= self._sizes.pop(key)
+
+    def pop(self, key, default=_MISSING):
+        if key in self:
+            value = super().pop(key)
+            self.currsize -= self._sizes.pop(key)
+            return value
+        if default is LRUCache._MISSING:
+            raise KeyError(key)
+        return default
+
+    def popitem(self, last: bool = True):
+        key, value = super().popitem(last=last)
+        self.currsize -= self._sizes.pop(key)
+        return key, value
+
+    def clear(self) -> None:
+        super().clear()
+        self._sizes.clear()
+        self.currsize = 0
+
+
+def _hsi_entry_nbytes(entry) -> int:
+    """
+    Size of an _hsi_cache entry (data, wavelengths) in bytes.
+    
+    Memmaps are paged by the OS and not counted; HSI_CACHE_MAX_ENTRIES bounds
+    how many of them (and their file handles) stay open.
+    """
+    return sum(a.nbytes for a in entry if a is not None and not isinstance(a, np.memmap))
+
+
+# =============================================================================
+# ITEM STORES
+# =============================================================================
+class _ItemStore:
+    """
+    Struct-of-arrays mirror of point / polygon dicts for vectorized filtering.
+    
+    The dict lists stay authoritative (editing, serialization); the arrays
+    are rebuilt lazily after mark_dirty().
+    """
+
+    def __init__(self, with_xy: bool = False, with_rings: bool = False):
+        self.with_xy = with_xy
+        self.with_rings = with_rings
+        self.dirty = True
+        self.src_id = np.empty(0, dtype=np.int32)
+        self.visible = np.empty(0, dtype=bool)
+        self.color = np.empty((0, 4), dtype=np.float64)
+        self.x = np.empty(0, dtype=np.int32)
+        self.y = np.empty(0, dtype=np.int32)
+        # ポリゴン用：閉じたリングを (P, Nmax + 1, 2) にパディング（余りは先頭頂点で埋める）
+        self.nverts = np.empty(0, dtype=np.int64)
+        self.rings = np.empty((0, 1, 2), dtype=np.float64)
+        self.bbox = np.empty((0, 4), dtype=np.float64)  # xmin, ymin, xmax, ymax
+        self.centroid = np.empty((0, 2), dtype=np.int64)  # 頂点平均（四捨五入、リスト表示用）
+
+    def mark_dirty(self) -> None:
+        self.dirty = True
+
+    def set_visible(self, i: int, visible: bool) -> None:
+        """Mirror a single visibility flip without a full rebuild."""
+        if not self.dirty and 0 <= i < len(self.visible):
+            self.visible[i] = visible
+
+    def sync(self, items: Sequence[Dict[str, Any]], src_id_of) -> "_ItemStore":
+        """Rebuild the arrays from items if they are stale."""
+        n = len(items)
+        if not self.dirty and n == len(self.visible):
+            return self
+        self.src_id = np.fromiter((src_id_of(it.get("source", "")) for it in items), dtype=np.int32, count=n)
+        self.visible = np.fromiter((bool(it.get("visible", True)) for it in items), dtype=bool, count=n)
+        self.color = to_rgba_array([it["color"] for it in items]) if n else np.empty((0, 4))
+        if self.with_xy:
+            self.x = np.fromiter((it["x"] for it in items), dtype=np.int32, count=n)
+            self.y = np.fromiter((it["y"] for it in items), dtype=np.int32, count=n)
+        if self.with_rings:
+            self.nverts = np.fromiter((len(it.get("verts") or ()) for it in items), dtype=np.int64, count=n)
+            rings = np.zeros((n, int(self.nverts.max(initial=0)) + 1, 2))
+            for k, it in enumerate(items):
+                vs = it.get("verts") or ()
+                if vs:
+                    rings[k, :len(vs)] = vs
+                    rings[k, len(vs):] = vs[0]
+            self.rings = rings
+            self.bbox = np.concatenate((rings.min(axis=1), rings.max(axis=1)), axis=1)
+            # パディング分（先頭頂点の繰り返し）を差し引いて頂点平均を出す
+            pad = (rings.shape[1] - self.nverts)[:, None] * rings[:, 0]
+            self.centroid = np.rint((rings.sum(axis=1) - pad)
+                                    / np.maximum(self.nverts, 1)[:, None]).astype(np.int64)
+        self.dirty = False
+        return self
+
+    def mask(self, src_id: int) -> np.ndarray:
+        """Boolean mask of visible items belonging to src_id."""
+        return self.visible & (self.src_id == src_id)
+
+
+# =============================================================================
+# NUMBA KERNELS
+# =============================================================================
+_POLY_STATS_CHUNKS: int = 64
+
+
+@_njit_kernel
+def _poly_stats_kernel(data, idx, i_lo, i_hi, absorbance, snv):
+    """
+    Fused per-pixel absorbance + SNV + mean/std over polygon pixels.
+
+    Reads each selected spectrum once and accumulates per-band sum / sum of
+    squares (NaN is skipped, same as np.nanmean / np.nanstd with ddof=0).
+
+    Args:
+        data: HSI cube (H, W, B), any numeric dtype
+        idx: Flat pixel indices (y * W + x)
+        i_lo, i_hi: Inclusive band range
+        absorbance: Convert to absorbance (-log10) before reduction
+        snv: Apply SNV per pixel before reduction
+
+    Returns:
+        (mean, std) as float32 arrays of length i_hi - i_lo + 1
+    """
+    W = data.shape[1]
+    nb = i_hi - i_lo + 1
+    n = idx.size
+    nch = min(_POLY_STATS_CHUNKS, max(n, 1))
+    acc = np.zeros((nch, nb))
+    acc2 = np.zeros((nch, nb))
+    cnt = np.zeros((nch, nb), dtype=np.int64)
+
+    for c in prange(nch):
+        v = np.empty(nb)
+        for j in range(c * n // nch, (c + 1) * n // nch):
+            y = idx[j] // W
+            x = idx[j] - y * W
+            vmax = -np.inf
+            for b in range(nb):
+                t = float(data[y, x, i_lo + b])
+                v[b] = t
+                if t > vmax:
+                    vmax = t
+            if absorbance:
+                # スケール自動判定（16bit想定）
+                scale = 1.0 / 65535.0 if vmax > 1.5 else 1.0
+                for b in range(nb):
+                    t = np.float32(v[b] * scale)
+                    if t < 1e-8:
+                        t = np.float32(1e-8)
+                    elif t > 1.0:
+                        t = np.float32(1.0)
+                    v[b] = -np.log10(t)
+            if snv:
+                m = 0.0
+                k = 0
+                for b in range(nb):
+                    if not np.isnan(v[b]):
+                        m += v[b]
+                        k += 1
+                if k > 0:
+                    m /= k
+                    q = 0.0
+                    for b in range(nb):
+                        if not np.isnan(v[b]):
+                            q += (v[b] - m) ** 2
+                    sd = np.sqrt(q / k)
+                    if not np.isfinite(sd) or sd == 0.0:
+                        sd = 1.0
+                    for b in range(nb):
+                        v[b] = (v[b] - m) / sd
+            for b in range(nb):
+                t = v[b]
+                if not np.isnan(t):
+                    acc[c, b] += t
+                    acc2[c, b] += t * t
+                    cnt[c, b] += 1
+
+    mean = np.empty(nb, dtype=np.float32)
+    std = np.empty(nb, dtype=np.float32)
+    for b in range(nb):
+        s = 0.0
+        s2 = 0.0
+        k = 0
+        for c in range(nch):
+            s += acc[c, b]
+            s2 += acc2[c, b]
+            k += cnt[c, b]
+        if k == 0:
+            mean[b] = np.nan
+            std[b] = np.nan
+        else:
+            mu = s / k
+            var = s2 / k - mu * mu
+            mean[b] = mu
+            std[b] = np.sqrt(var) if var > 0.0 else 0.0
+    return mean, std
+
+
+@_njit_kernel
+def _mean_std_nan(data, idx):
+    """
+    Per-band mean / std (ddof=0) over polygon pixels in a single pass, skipping NaN.
+
+    Welford accumulation per chunk of pixels, chunks merged with Chan's formula
+    (same result as np.nanmean / np.nanstd). Reads the cube in its own dtype.
+
+    Args:
+        data: HSI cube (H, W, B), any numeric dtype
+        idx: Flat pixel indices (y * W + x)
+
+    Returns:
+        (mean, std) as float64 arrays of length B
+    """
+    W = data.shape[1]
+    B = data.shape[2]
+    n = idx.size
+    nch = min(_POLY_STATS_CHUNKS, max(n, 1))
+    cnt = np.zeros((nch, B), dtype=np.int64)
+    mu = np.zeros((nch, B))
+    m2 = np.zeros((nch, B))
+
+    for c in prange(nch):
+        for j in range(c * n // nch, (c + 1) * n // nch):
+            y = idx[j] // W
+            x = idx[j] - y * W
+            for b in range(B):
+                v = float(data[y, x, b])
+                if not np.isnan(v):
+                    k = cnt[c, b] + 1
+                    cnt[c, b] = k
+                    dv = v - mu[c, b]
+                    mu[c, b] += dv / k
+                    m2[c, b] += dv * (v - mu[c, b])
+
+    mean = np.empty(B)
+    std = np.empty(B)
+    for b in range(B):
+        k = 0
+        m = 0.0
+        s2 = 0.0
+        for c in range(nch):
+            kc = cnt[c, b]
+            if kc == 0:
+                continue
+            tot = k + kc
+            dm = mu[c, b] - m
+            m += dm * kc / tot
+            s2 += m2[c, b] + dm * dm * k * kc / tot
+            k = tot
+        if k == 0:
+            mean[b] = np.nan
+            std[b] = np.nan
+        else:
+            mean[b] = m
+            std[b] = np.sqrt(s2 / k)
+    return mean, std
+
+
+@_njit_kernel
+def _rasterize_polygon(verts, H, W):
+    """
+    Flat indices (y * W + x) of pixels inside a polygon, in row-major order.
+
+    Scans only the bbox rows in parallel; per row, only edges straddling it
+    are tested, with the same crossing rule as matplotlib's point_in_path
+    (identical result to Path(verts).contains_points on the pixel grid).
+
+    Args:
+        verts: Vertices (N, 2) float64, ring closed implicitly (N < 3 -> empty)
+        H, W: Image size
+    """
+    n = verts.shape[0]
+    if n < 3:
+        return np.empty(0, dtype=np.int64)
+    x0 = max(0, int(np.floor(verts[:, 0].min())))
+    x1 = min(W, int(np.floor(verts[:, 0].max())) + 1)
+    y0 = max(0, int(np.floor(verts[:, 1].min())))
+    y1 = min(H, int(np.floor(verts[:, 1].max())) + 1)
+    if x1 <= x0 or y1 <= y0:
+        return np.empty(0, dtype=np.int64)
+    nr, nc = y1 - y0, x1 - x0
+    mask = np.zeros((nr, nc), dtype=np.bool_)
+    counts = np.zeros(nr, dtype=np.int64)
+
+    for r in prange(nr):
+        ty = float(y0 + r)
+        edges = np.empty(n, dtype=np.int64)
+        k = 0
+        for i in range(n):
+            j = i - 1 if i > 0 else n - 1
+            if (verts[j, 1] >= ty) != (verts[i, 1] >= ty):
+                edges[k] = i
+                k += 1
+        c = 0
+        for col in range(nc):
+            tx = float(x0 + col)
+            inside = False
+            for e in range(k):
+                i = edges[e]
+                j = i - 1 if i > 0 else n - 1
+                yflag1 = verts[i, 1] >= ty
+                if (((verts[i, 1] - ty) * (verts[j, 0] - verts[i, 0])
+                     >= (verts[i, 0] - tx) * (verts[j, 1] - verts[i, 1])) == yflag1):
+                    inside = not inside
+            if inside:
+                mask[r, col] = True
+                c += 1
+        counts[r] = c
+
+    offs = np.zeros(nr + 1, dtype=np.int64)
+    for r in range(nr):
+        offs[r + 1] = offs[r] + counts[r]
+    out = np.empty(offs[nr], dtype=np.int64)
+    for r in prange(nr):
+        o = offs[r]
+        for col in range(nc):
+            if mask[r, col]:
+                out[o] = (y0 + r) * W + x0 + col
+                o += 1
+    return out
+
+
+@_njit_kernel
+def _rgb_pack_kernel(r, g, b, lo, scale, out):
+    """
+    Fused stretch of three band images into an interleaved uint8 (H, W, 3).
+
+    Same arithmetic as HyperspecTk.stretch_u8 (float32, clip to 0-255, NaN -> 0,
+    truncation); a channel with scale 0 is written as 0.
+
+    Args:
+        r, g, b: Band images (H, W), any numeric dtype
+        lo: Lower stretch limit per channel (3,)
+        scale: 255 / (high - low) per channel (3,), 0 for a degenerate range
+        out: Output array (H, W, 3) uint8
     """
-    return width - 1 - x
+    H, W = r.shape
+    lo32 = lo.astype(np.float32)
+    sc32 = scale.astype(np.float32)
+    for i in prange(H):
+        for j in range(W):
+            for c in range(3):
+                if c == 0:
+                    v = np.float32(r[i, j])
+                elif c == 1:
+                    v = np.float32(g[i, j])
+                else:
+                    v = np.float32(b[i, j])
+                t = (v - lo32[c]) * sc32[c]
+                if t > 255.0:
+                    t = np.float32(255.0)
+                elif not (t > 0.0):  # 負値・NaN
+                    t = np.float32(0.0)
+                out[i, j, c] = np.uint8(t)
+    return out
 
 
 # =============================================================================
@@ -486,9 +1092,12 @@ class HyperspecTk(tk.Tk):
         # Points and polygons
         self.points: List[Dict[str, Any]] = []
         self.external_spectra: List[Any] = []
-        self._pt_color_idx = 0
         self.polygons: List[Dict[str, Any]] = []
-        self._pg_color_idx = 0
+        self._reset_color_cycles(0, 0)
+        # SoA ミラー（描画時のフィルタをベクトル化、変更時は _items_changed() を呼ぶ）
+        self._pt_store = _ItemStore(with_xy=True)
+        self._pg_store = _ItemStore(with_rings=True)
+        self._src_id_map: Dict[str, int] = {}
         
         # Processing mode
         self.mode_var = tk.StringVar(value="Reflectance")
@@ -497,11 +1106,36 @@ class HyperspecTk(tk.Tk):
         self.sg_deriv_var = tk.StringVar(value="0th")
         
         # Caches
-        self._hsi_cache: Dict[str, Tuple[Optional[np.ndarray], Optional[np.ndarray]]] = {}
-        self._pt_raw_cache: Dict[Tuple[str, int, int], np.ndarray] = {}
-        self._pt_proc_cache: Dict[Tuple, np.ndarray] = {}
-        self._poly_idx_cache: Dict[Tuple[str, Tuple[Tuple[int, int], ...]], np.ndarray] = {}
-        self._poly_proc_cache: Dict[Tuple, Tuple[np.ndarray, np.ndarray, np.ndarray, int]] = {}
+        self._hsi_cache: Dict[str, Tuple[Optional[np.ndarray], Optional[np.ndarray]]] = LRUCache(
+            HSI_CACHE_MAX_BYTES, getsizeof=_hsi_entry_nbytes, maxcount=HSI_CACHE_MAX_ENTRIES)
+        self._pt_raw_cache: Dict[Tuple[str, int, int], np.ndarray] = LRUCache(PT_CACHE_MAX)
+        self._pt_proc_cache: Dict[Tuple, np.ndarray] = LRUCache(PT_CACHE_MAX, on_evict=self._on_pt_proc_evict)
+        self._poly_idx_cache: Dict[Tuple[str, tuple], np.ndarray] = LRUCache(POLY_CACHE_MAX)
+        self._poly_proc_cache: Dict[Tuple, Tuple[np.ndarray, np.ndarray, np.ndarray, int]] = LRUCache(
+            POLY_CACHE_MAX, on_evict=self._on_poly_proc_evict)
+        self._stretch_cache: Dict[Tuple[int, int], Tuple[float, float]] = {}
+        self._wl_grid_cache: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._src_exists_cache: Dict[str, Tuple[bool, float]] = {}  # path -> (exists, checked_at)
+        
+        # Persistent artists (updated in place instead of cla + replot)
+        self._img_artists: Dict[str, Any] = {"gray": None, "rgb": None}
+        self._overlay_artists: Dict[Any, Dict[str, Any]] = {}
+        self._blit_bg: Dict[Any, Any] = {}  # axes -> 背景画像（オーバーレイのblit用）
+        self._overlay_static = False  # 保存中はオーバーレイを通常描画に含める
+        # 表示更新の集約（_request_update → after_idle で1回だけ実行）
+        self._dirty_views: set = set()
+        self._update_show_status = False  # 集約した spec 再描画で進捗ステータスを出すか
+        self._update_after_id = None
+        # 非表示タブの画像は描かず、タブ選択時にまとめて描く
+        self._pending_redraw: Dict[str, bool] = {"gray": False, "rgb": False}
+        # 画像ビューの内容世代（画像・オーバーレイ更新で +1）と最後に保存した PNG
+        self._img_gen: Dict[Any, int] = {}
+        self._last_png: Dict[Any, Tuple[tuple, str, int]] = {}  # axes -> (signature, path, mtime_ns)
+        self._spec_lines: Dict[Tuple[str, int], Any] = {}
+        self._spec_fills: List[Any] = []
+        # 逆引きインデックス（無効化をキー走査なしで行う）
+        self._pt_proc_keys_by_raw: Dict[Tuple[str, int, int], set] = {}
+        self._poly_proc_keys_by_base: Dict[Tuple[str, tuple], set] = {}
         
         # Polygon drawing state
         self.poly_mode = tk.BooleanVar(value=False)
@@ -519,6 +1153,7 @@ class HyperspecTk(tk.Tk):
         # ポリゴン処理設定を追加
         self.poly_approx_mode = False  # False=厳密, True=近似
         self.poly_downsample_threshold = 0  # 0=無効, >0でダウンサンプリング
+        self.poly_fast_stats = False  # True: 大きいポリゴンはスケッチ（固定サンプル）で統計
 
         self._plot_range_dragging = False
 
@@ -548,14 +1183,14 @@ class HyperspecTk(tk.Tk):
         """Open filter parameters dialog."""
         dlg = tk.Toplevel(self)
         dlg.title("Filter & Processing Parameters")
-        dlg.geometry("480x320")
+        dlg.geometry("480x350")
         dlg.resizable(False, False)
         dlg.transient(self)
         
         # Center dialog
         self.update_idletasks()
         x = self.winfo_x() + (self.winfo_width() - 480) // 2
-        y = self.winfo_y() + (self.winfo_height() - 320) // 2
+        y = self.winfo_y() + (self.winfo_height() - 350) // 2
         dlg.geometry(f"+{x}+{y}")
         
         frm = ttk.Frame(dlg, padding=20)
@@ -600,15 +1235,22 @@ class HyperspecTk(tk.Tk):
         ds_spin.grid(row=6, column=1, sticky="w", padx=10)
         ttk.Label(frm, text="(0=disabled)", foreground="gray").grid(row=6, column=2, sticky="w")
         
+        # Fast stats (sketch)
+        fast_var = tk.BooleanVar(value=self.poly_fast_stats)
+        fast_check = ttk.Checkbutton(
+            frm, text=f"Fast stats (sample {SKETCH_SIZE:,} px if > {SKETCH_THRESHOLD:,} px)",
+            variable=fast_var)
+        fast_check.grid(row=7, column=0, columnspan=3, sticky="w", pady=4)
+        
         # Info
         bands = self.wavelengths.size if self.wavelengths is not None else 0
         info = f"Current bands: {bands}"
         ttk.Label(frm, text=info, foreground="gray").grid(
-            row=7, column=0, columnspan=3, pady=(15, 0))
+            row=8, column=0, columnspan=3, pady=(15, 0))
         
         # Buttons
         btn_frm = ttk.Frame(frm)
-        btn_frm.grid(row=8, column=0, columnspan=3, sticky="e", pady=(20, 0))
+        btn_frm.grid(row=9, column=0, columnspan=3, sticky="e", pady=(20, 0))
         
         def apply():
             # 奇数に調整
@@ -620,10 +1262,10 @@ class HyperspecTk(tk.Tk):
             # ポリゴン設定
             self.poly_approx_mode = approx_var.get()
             self.poly_downsample_threshold = max(0, ds_var.get())
+            self.poly_fast_stats = fast_var.get()
             
             # キャッシュクリアして再描画
-            self._pt_proc_cache.clear()
-            self._poly_proc_cache.clear()
+            self._clear_proc_caches()
             self._redraw_spec_lines()
             dlg.destroy()
         
@@ -710,6 +1352,7 @@ class HyperspecTk(tk.Tk):
         self.gray_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         self.gray_fig.canvas.mpl_connect("button_press_event", self.on_image_click)
         self.gray_canvas.mpl_connect("button_press_event", self._on_middle_click_toggle)
+        self.gray_canvas.mpl_connect("draw_event", lambda e: self._on_image_canvas_draw(self.ax_gray))
 
     def _build_rgb_tab(self) -> None:
         """Build pseudo RGB tab."""
@@ -740,6 +1383,7 @@ class HyperspecTk(tk.Tk):
         self.rgb_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         self.rgb_fig.canvas.mpl_connect("button_press_event", self.on_image_click)
         self.rgb_canvas.mpl_connect("button_press_event", self._on_middle_click_toggle)
+        self.rgb_canvas.mpl_connect("draw_event", lambda e: self._on_image_canvas_draw(self.ax_rgb))
 
     def _make_rgb_slider(self, parent, label: str, var: tk.DoubleVar) -> Tuple[tk.Scale, tk.StringVar]:
         """Create RGB wavelength slider."""
@@ -1018,6 +1662,11 @@ class HyperspecTk(tk.Tk):
         # Treeview
         cols = ("id", "label", "view", "x", "y", "source")
         self.tree = ttk.Treeview(self._pts_frame, columns=cols, show="headings", height=4)
+        self._tree_row_state: Dict[str, tuple] = {}  # iid -> 表示中の values（差分更新用）
+        self._tree_row_item: Dict[str, dict] = {}  # iid -> 表示中の点/ポリゴン（行IDは位置なので中身の入れ替わり検出用）
+        # ラベルのインライン編集：Entry は初回に1つだけ作り、以後は place / place_forget で使い回す
+        self._tv_inline_entry: Optional[ttk.Entry] = None
+        self._tv_inline_iid: Optional[str] = None  # 編集中の行（None なら非編集）
         for c, w in zip(cols, (70, 160, 60, 70, 70, 220)):
             self.tree.heading(c, text=c.upper())
             self.tree.column(c, width=w, anchor="w")
@@ -1165,7 +1814,7 @@ class HyperspecTk(tk.Tk):
         
         # Show loading status
         if show_status:  # ← 追加
-            self._set_status("Loading HDR file...")
+            self._set_status("Loading HDR file...", flush=True)
         abs_path = os.path.abspath(path)
         self._hsi_cache.pop(abs_path, None) # 既存キャッシュを削除して再読み込み
         
@@ -1186,6 +1835,7 @@ class HyperspecTk(tk.Tk):
         self._view_forced_reset_rgb = True
         self.img = img
         self.data = data
+        self._stretch_cache.clear()
         self.path_var.set(os.path.abspath(path))
 
         # Extract wavelengths
@@ -1237,6 +1887,8 @@ class HyperspecTk(tk.Tk):
 
         self.reset_spectra()
         self._clear_all_caches()
+        # 新しいキューブを描画（非表示タブはタブ選択時）
+        self._request_image_update("gray", "rgb")
         
         # Show completion status
         if show_status:  # ← 追加
@@ -1272,27 +1924,20 @@ class HyperspecTk(tk.Tk):
             return
         
         ax = self.ax_gray
-        view = self._capture_view_if_meaningful(ax, "gray")
         
         b = int(np.clip(self.gray_band, 0, self.data.shape[2] - 1))
         wl = float(self.wavelengths[b])
         
-        ax.cla()
-        ax.set_title(f"Gray — λ={wl:.1f} nm (Band {b})")
-        ax.set_xticks([])
-        ax.set_yticks([])
-        # Horizontally flip image for correct orientation
         # Replace NaN with 0 for display (minimal change to keep downstream logic)
         img_band = self.data[:, :, b]
         img_band = np.nan_to_num(img_band, nan=0.0)
-        ax.imshow(np.fliplr(img_band), cmap=self.cmap_name.get(), vmin=0, vmax=65535, zorder=0)
+        self._show_image(ax, "gray", img_band, cmap=self.cmap_name.get(), vmin=0, vmax=65535)
+        ax.set_title(f"Gray — λ={wl:.1f} nm (Band {b})")
         
         self._draw_markers(ax)
         self._draw_polygons(ax)
         
-        if view is not None:
-            self._restore_view(ax, view)
-        
+        self._blit_bg.pop(ax, None)  # 背景が変わる → 次の描画で取り直す
         self.gray_canvas.draw_idle()
         self._view_forced_reset_gray = False
 
@@ -1302,17 +1947,17 @@ class HyperspecTk(tk.Tk):
             return
         
         ax = self.ax_rgb
-        view = self._capture_view_if_meaningful(ax, "rgb")
         
         R = self.rgb_bands["R"]
         G = self.rgb_bands["G"]
         Bn = self.rgb_bands["B"]
         
-        ax.cla()
-        ax.set_xticks([])
-        ax.set_yticks([])
-        
         if None in (R, G, Bn):
+            view = self._capture_view_if_meaningful(ax, "rgb")
+            self._reset_image_axes(ax)
+            self._img_artists["rgb"] = None
+            if view is not None:
+                self._restore_view(ax, view)
             ax.set_title("Pseudo RGB (select R/G/B)")
         else:
             R = int(np.clip(R, 0, self.data.shape[2] - 1))
@@ -1323,34 +1968,146 @@ class HyperspecTk(tk.Tk):
             wlG = float(self.wavelengths[G])
             wlB = float(self.wavelengths[Bn])
             
-            rgb = np.dstack([
-                self.stretch01(self.data[:, :, R]),
-                self.stretch01(self.data[:, :, G]),
-                self.stretch01(self.data[:, :, Bn])
-            ])
-            # Replace NaN with 0 for display (minimal change)
-            rgb = np.nan_to_num(rgb, nan=0.0)
+            # 8bit RGBで直接構築（NaNは0として表示）
+            H, W = self.data.shape[:2]
+            rgb = np.empty((H, W, 3), dtype=np.uint8)
+            if HAS_NUMBA:
+                # 3バンドのストレッチ＋インターリーブを1パスで
+                lims = [self._band_stretch_limits(b) for b in (R, G, Bn)]
+                lo = np.array([v1 for v1, _ in lims], dtype=np.float64)
+                scale = np.array([255.0 / (v2 - v1) if (v2 - v1) and np.isfinite(v2 - v1) else 0.0
+                                  for v1, v2 in lims], dtype=np.float64)
+                _rgb_pack_kernel(self.data[:, :, R], self.data[:, :, G], self.data[:, :, Bn], lo, scale, rgb)
+            else:
+                for c, b in enumerate((R, G, Bn)):
+                    self.stretch_u8(self.data[:, :, b], limits=self._band_stretch_limits(b), out=rgb[:, :, c])
             
+            self._show_image(ax, "rgb", rgb)
             ax.set_title(f"Pseudo RGB — λ: {wlR:.1f}/{wlG:.1f}/{wlB:.1f} nm\n(Bands: {R}/{G}/{Bn})")
-            # Horizontally flip RGB image for correct orientation
-            ax.imshow(np.fliplr(rgb), zorder=0)
         
         self._draw_markers(ax)
         self._draw_polygons(ax)
         
-        if view is not None:
-            self._restore_view(ax, view)
-        
+        self._blit_bg.pop(ax, None)  # 背景が変わる → 次の描画で取り直す
         self.rgb_canvas.draw_idle()
         self._view_forced_reset_rgb = False
 
+    def _show_image(self, ax, which: str, img: np.ndarray, **imshow_kw) -> None:
+        """
+        Show image on axis, updating the existing AxesImage in place when possible.
+        
+        The axes are rebuilt (cla + imshow) only on first use, after a forced view
+        reset (new file) or when the image shape changes; otherwise the view is
+        left untouched.
+        """
+        self._touch_image_axes(ax)
+        art = self._img_artists.get(which)
+        forced = self._view_forced_reset_gray if which == "gray" else self._view_forced_reset_rgb
+        if art is not None and art.axes is ax and not forced and art.get_array().shape == img.shape:
+            art.set_data(img)
+            if "cmap" in imshow_kw:
+                art.set_cmap(imshow_kw["cmap"])
+            return
+        
+        view = self._capture_view_if_meaningful(ax, which)
+        self._reset_image_axes(ax)
+        self._img_artists[which] = ax.imshow(img, zorder=0, **imshow_kw)
+        # Horizontally flip for correct orientation (axis inversion, no array copy)
+        ax.xaxis.set_inverted(True)
+        if view is not None:
+            self._restore_view(ax, view)
+
+    def _touch_image_axes(self, ax) -> None:
+        """Bump the content generation of an image view (invalidates its saved PNG)."""
+        self._img_gen[ax] = self._img_gen.get(ax, 0) + 1
+
+    def _image_png_signature(self, ax) -> tuple:
+        """State that determines the saved PNG of an image view."""
+        return (self._img_gen.get(ax, 0), ax.get_xlim(), ax.get_ylim(), ax.get_title())
+
+    def _reset_image_axes(self, ax) -> None:
+        """Clear image axis (drops persistent overlay artists)."""
+        self._touch_image_axes(ax)
+        ax.cla()
+        ax.set_xticks([])
+        ax.set_yticks([])
+        self._overlay_artists.pop(ax, None)
+
+    def _overlay(self, ax) -> Dict[str, Any]:
+        """Get persistent marker/polygon overlay artists of axis (created on demand)."""
+        ov = self._overlay_artists.get(ax)
+        if ov is None:
+            ov = {
+                # オーバーレイは animated（通常描画から外し、背景画像の上に blit で重ねる）
+                "markers": ax.scatter([], [], marker='+', s=10 ** 2, linewidths=1.8,
+                                      zorder=3, clip_on=True, animated=True),
+                "outlines": ax.add_collection(LineCollection([], linewidths=1.5, linestyles='-',
+                                                             zorder=5, clip_on=True, animated=True),
+                                              autolim=False),
+                "verts": ax.scatter([], [], marker='o', s=5.5 ** 2, facecolors='none',
+                                    linewidths=1.4, zorder=6, clip_on=True, animated=True),
+                "temp_line": ax.plot([], [], lw=1.0, linestyle='--', color='k', zorder=7, clip_on=True,
+                                     animated=True)[0],
+                "temp_verts": ax.scatter([], [], marker='o', s=6.0 ** 2, facecolors='none',
+                                         edgecolors='k', linewidths=1.2, zorder=8, clip_on=True,
+                                         animated=True),
+            }
+            self._overlay_artists[ax] = ov
+        return ov
+
     @staticmethod
-    def stretch01(img: np.ndarray, low: int = PERCENTILE_LOW, high: int = PERCENTILE_HIGH) -> np.ndarray:
-        """Stretch image to 0-1 range using percentiles."""
-        v1, v2 = np.nanpercentile(img, [low, high])
-        if v2 - v1 == 0:
-            return np.zeros_like(img, dtype=float)
-        return np.clip((img - v1) / (v2 - v1), 0, 1)
+    def stretch_u8(img: np.ndarray, low: int = PERCENTILE_LOW, high: int = PERCENTILE_HIGH,
+                   limits: Optional[Tuple[float, float]] = None,
+                   out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Stretch image to 0-255 uint8 for display (NaN -> 0)."""
+        v1, v2 = limits if limits is not None else HyperspecTk.percentile_limits(img, low, high)
+        if out is None:
+            out = np.empty(img.shape, dtype=np.uint8)
+        if not (v2 - v1) or not np.isfinite(v2 - v1):
+            out[...] = 0
+            return out
+        
+        t = np.subtract(img, np.float32(v1), dtype=np.float32)
+        t *= np.float32(255.0 / (v2 - v1))
+        np.clip(t, 0, 255, out=t)
+        if img.dtype.kind == "f":
+            t[np.isnan(t)] = 0
+        out[...] = t  # 切り捨て（matplotlibのfloat→uint8変換と同じ）
+        return out
+
+    @staticmethod
+    def percentile_limits(img: np.ndarray, low: int = PERCENTILE_LOW, high: int = PERCENTILE_HIGH) -> Tuple[float, float]:
+        """
+        Low/high percentiles of finite pixels via np.partition (linear interpolation,
+        same as np.nanpercentile). Large images are sampled with a fixed stride.
+        """
+        flat = np.asarray(img).ravel()
+        step = -(-flat.size // STRETCH_SAMPLE_MAX)
+        if step > 1:
+            flat = flat[::step]
+        v = flat[~np.isnan(flat)] if flat.dtype.kind == "f" else flat
+        n = v.size
+        if n == 0:
+            return (np.nan, np.nan)
+        
+        pos = [q * 0.01 * (n - 1) for q in (low, high)]
+        kth = sorted({min(int(p) + j, n - 1) for p in pos for j in (0, 1)})
+        part = np.partition(v, kth)
+        out = []
+        for p in pos:
+            k = int(p)
+            a = float(part[k])
+            out.append(a + (float(part[min(k + 1, n - 1)]) - a) * (p - k))
+        return (out[0], out[1])
+
+    def _band_stretch_limits(self, b: int) -> Tuple[float, float]:
+        """Get RGB stretch limits for a band of the current cube (cached)."""
+        key = (id(self.data), int(b))
+        lim = self._stretch_cache.get(key)
+        if lim is None:
+            lim = self.percentile_limits(self.data[:, :, b])
+            self._stretch_cache[key] = lim
+        return lim
 
     def _update_gray_label(self) -> None:
         """Update gray image wavelength label."""
@@ -1374,58 +2131,121 @@ class HyperspecTk(tk.Tk):
     # =========================================================================
     def _draw_markers(self, ax) -> None:
         """Draw point markers on axis."""
-        cur_src = self.path_var.get()
-        # Get image width for coordinate transformation
-        W = self.data.shape[1] if self.data is not None else 1
-        
-        for p in self.points:
-            if not self._same_source(p.get("source", ""), cur_src):
-                continue
-            if not p.get("visible", True):
-                continue
-            # Transform x coordinate from data space to display space
-            x_display = flip_x_for_display(p["x"], W)
-            ax.plot(x_display, p["y"], marker='+', color=p["color"],
-                    markersize=10, markeredgewidth=1.8, zorder=3, clip_on=True)
+        self._touch_image_axes(ax)
+        st = self._pt_store.sync(self.points, self._src_id)
+        mask = st.mask(self._src_id(self.path_var.get()))
+        
+        # 全マーカーを1つのPathCollectionで描画（アーティストは使い回す）
+        art = self._overlay(ax)["markers"]
+        if mask.any():
+            art.set_offsets(np.column_stack((st.x[mask], st.y[mask])))
+            art.set_color(st.color[mask])
+        else:
+            art.set_offsets(np.empty((0, 2)))
 
     def _draw_polygons(self, ax) -> None:
         """Draw polygons on axis."""
-        cur_src = self.path_var.get()
-        # Get image width for coordinate transformation
-        W = self.data.shape[1] if self.data is not None else 1
-        
-        # Draw finalized polygons
-        for pg in self.polygons:
-            if not self._same_source(pg.get("source", ""), cur_src):
-                continue
-            if not pg.get("visible", True):
-                continue
-            
+        self._touch_image_axes(ax)
+        ov = self._overlay(ax)
+        st = self._pg_store.sync(self.polygons, self._src_id)
+        mask = st.mask(self._src_id(self.path_var.get()))
+        
+        # Draw finalized polygons (outlines: LineCollection, vertices: PathCollection)
+        segments, seg_colors = [], []
+        vert_xy, vert_colors = [], []
+        for i in np.flatnonzero(mask):
+            pg = self.polygons[i]
             vs = pg.get("verts") or []
             if not vs:
                 continue
             
-            # Transform vertices from data space to display space
-            vs_display = [(flip_x_for_display(x, W), y) for x, y in vs]
-            xs, ys = zip(*vs_display)
+            # Closed ring for drawing (cached per polygon)
+            ring = self._poly_cached(pg, "_closed_disp", verts_to_display, True)
+            vs_display = ring[:-1]
             if len(vs) >= 2:
-                ax.plot(xs + (xs[0],), ys + (ys[0],), lw=1.5, linestyle='-',
-                        color=pg["color"], zorder=5, clip_on=True)
-            
-            for (vx, vy) in vs_display:
-                ax.plot(vx, vy, marker='o', markersize=5.5, markerfacecolor='none',
-                        markeredgewidth=1.4, markeredgecolor=pg["color"], zorder=6, clip_on=True)
+                segments.append(ring)
+                seg_colors.append(pg["color"])
+            vert_xy.append(vs_display)
+            vert_colors.extend([pg["color"]] * len(vs_display))
+        
+        ov["outlines"].set_segments(segments)
+        if seg_colors:
+            ov["outlines"].set_color(seg_colors)
+        ov["verts"].set_offsets(np.concatenate(vert_xy) if vert_xy else np.empty((0, 2)))
+        if vert_colors:
+            ov["verts"].set_edgecolor(vert_colors)
 
         # Draw temporary polygon being drawn
+        self._update_temp_polygon(ax)
+
+    def _update_temp_polygon(self, ax) -> None:
+        """Update data of the temporary (being drawn) polygon artists."""
+        ov = self._overlay(ax)
         if self.poly_mode.get() and self._poly_temp_verts and (ax is self._poly_drawing_axes):
-            # Transform temporary vertices to display space
-            temp_display = [(flip_x_for_display(x, W), y) for x, y in self._poly_temp_verts]
-            xs, ys = zip(*temp_display)
-            if len(xs) >= 2:
-                ax.plot(xs, ys, lw=1.0, linestyle='--', color='k', zorder=7, clip_on=True)
-            for (vx, vy) in temp_display:
-                ax.plot(vx, vy, marker='o', markersize=6.0, markerfacecolor='none',
-                        markeredgewidth=1.2, markeredgecolor='k', zorder=8, clip_on=True)
+            temp_display = verts_to_display(self._poly_temp_verts)
+        else:
+            temp_display = np.empty((0, 2), dtype=np.float32)
+        if len(temp_display) >= 2:
+            ov["temp_line"].set_data(temp_display[:, 0], temp_display[:, 1])
+        else:
+            ov["temp_line"].set_data([], [])
+        ov["temp_verts"].set_offsets(temp_display)
+
+    def _draw_animated_overlay(self, ax) -> None:
+        """Draw animated overlay artists of axis onto the current canvas buffer."""
+        ov = self._overlay_artists.get(ax)
+        if ov is None:
+            return
+        for art in sorted(ov.values(), key=lambda a: a.get_zorder()):
+            if art.get_animated():
+                ax.draw_artist(art)
+
+    def _on_image_canvas_draw(self, ax) -> None:
+        """draw_event: keep clean background for blitting, then draw animated overlay."""
+        if self._overlay_static:
+            return
+        canvas = ax.figure.canvas
+        self._blit_bg[ax] = canvas.copy_from_bbox(ax.bbox)
+        self._draw_animated_overlay(ax)
+
+    def _set_overlay_static(self, ax, static: bool) -> None:
+        """Include persistent overlays in normal draws (for savefig) or blit them only."""
+        self._overlay_static = static
+        self._blit_bg.pop(ax, None)  # 保存時はサイズが変わるので背景は取り直す
+        ov = self._overlay_artists.get(ax)
+        if ov is None:
+            return
+        for k in ("markers", "outlines", "verts"):
+            ov[k].set_animated(not static)
+
+    def _blit_overlay(self, ax) -> None:
+        """Restore the cached background of axis and redraw only the overlay artists."""
+        canvas = ax.figure.canvas
+        bg = self._blit_bg.get(ax)
+        if bg is None:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(bg)
+        self._draw_animated_overlay(ax)
+        canvas.blit(ax.bbox)
+
+    def _blit_temp_polygon(self, ax) -> None:
+        """Redraw only the temporary polygon (no image re-render)."""
+        self._update_temp_polygon(ax)
+        self._blit_overlay(ax)
+
+    def _update_overlays(self) -> None:
+        """Redraw markers/polygons on the visible image view without re-rendering the image."""
+        if self.data is None:
+            return
+        active = self._active_image_view()
+        for name, ax in (("gray", self.ax_gray), ("rgb", self.ax_rgb)):
+            if name != active:
+                self._pending_redraw[name] = True  # タブ選択時に再描画
+                continue
+            self._draw_markers(ax)
+            self._draw_polygons(ax)
+            self._blit_overlay(ax)
 
     # =========================================================================
     # SLIDER AND TAB HANDLERS
@@ -1452,7 +2272,7 @@ class HyperspecTk(tk.Tk):
             self.gray_band = idx
             self.gray_scale_var.set(float(self.wavelengths[idx]))
             self._update_gray_label()
-            self._update_gray_image()
+            self._request_image_update("gray")
         finally:
             self._snapping = False
 
@@ -1472,7 +2292,7 @@ class HyperspecTk(tk.Tk):
             self.b_var.set(float(self.wavelengths[self.rgb_bands["B"]]))
             
             self._update_rgb_labels()
-            self._update_rgb_image()
+            self._request_image_update("rgb")
         finally:
             self._snapping = False
 
@@ -1484,11 +2304,34 @@ class HyperspecTk(tk.Tk):
         nb = event.widget
         tab = nb.nametowidget(nb.select())
         
-        if tab is self.tab_gray:
+        # 非表示中に更新が溜まったビューだけ描き直す（変化がなければキャンバスはそのまま）
+        if tab is self.tab_gray and self._pending_redraw["gray"]:
+            self._pending_redraw["gray"] = False
             self._update_gray_image()
-        elif tab is self.tab_rgb:
+        elif tab is self.tab_rgb and self._pending_redraw["rgb"]:
+            self._pending_redraw["rgb"] = False
             self._update_rgb_image()
 
+    def _active_image_view(self) -> str:
+        """Name of the image view on the selected notebook tab ("gray" / "rgb")."""
+        try:
+            return "rgb" if self.nb.index(self.nb.select()) == 1 else "gray"
+        except Exception:
+            return "gray"
+
+    def _request_image_update(self, *views: str) -> None:
+        """Redraw the given image views now if visible, otherwise on their next tab selection."""
+        active = self._active_image_view()
+        for v in views:
+            if v != active:
+                self._pending_redraw[v] = True
+                continue
+            self._pending_redraw[v] = False
+            if v == "gray":
+                self._update_gray_image()
+            else:
+                self._update_rgb_image()
+
     # =========================================================================
     # SPECTRAL PLOT MANAGEMENT
     # =========================================================================
@@ -1807,19 +2650,22 @@ class HyperspecTk(tk.Tk):
         # Show status for large dataset processing
         total_items = len(self.points) + len(self.polygons)
         if show_status and total_items > 5:
-            self._set_status(f"Redrawing {total_items} spectra...")
+            self._set_status(f"Redrawing {total_items} spectra...", flush=True)
         
         ax = self.ax_spec
-        ax.cla()
         self._style_spec_axes()
+        # ±1σ帯は毎回作り直す（線はキーごとに使い回す）
+        for art in self._spec_fills:
+            art.remove()
+        self._spec_fills = []
+        handles = []
         
         s, i_lo, i_hi = self._current_plot_slice_and_bounds()
         if i_lo is None:
+            self._sync_spec_lines(handles)
             self.spec_canvas.draw_idle()
             self._clear_status()
             return
-
-        line_count = 0
         
         # Draw points
         for p in self.points:
@@ -1830,9 +2676,11 @@ class HyperspecTk(tk.Tk):
             if wl_plot is None:
                 continue
             
-            ax.plot(wl_plot, y_plot, marker='o', lw=1.5, markersize=2.5,
-                    color=p["color"], label=self._legend_for_point(p))
-            line_count += 1
+            line = self._spec_line(("pt", id(p)), marker='o', lw=1.5, markersize=2.5)
+            line.set_data(wl_plot, y_plot)
+            line.set_color(p["color"])
+            line.set_label(self._legend_for_point(p))
+            handles.append(line)
 
         # Draw polygons
         for i, pg in enumerate(self.polygons):
@@ -1851,18 +2699,19 @@ class HyperspecTk(tk.Tk):
             if src and (src != cur):
                 base_label += f" @{os.path.basename(src)}"
             
-            ax.plot(wl_plot, y_mean, lw=2.0, linestyle='-', color=pg["color"], label=base_label)
+            line = self._spec_line(("pg", id(pg)), lw=2.0, linestyle='-')
+            line.set_data(wl_plot, y_mean)
+            line.set_color(pg["color"])
+            line.set_label(base_label)
+            handles.append(line)
             
             try:
-                ax.fill_between(wl_plot, y_mean - y_std, y_mean + y_std,
-                                alpha=0.25, linewidth=0, facecolor=pg["color"])
+                self._spec_fills.append(ax.fill_between(wl_plot, y_mean - y_std, y_mean + y_std,
+                                                        alpha=0.25, linewidth=0, facecolor=pg["color"]))
             except Exception:
                 pass
-            
-            line_count += 1
 
-        if line_count > 0:
-            ax.legend(loc='best')
+        self._sync_spec_lines(handles)
         
         # ★ Y軸範囲を適用
         self._apply_y_range()
@@ -1873,6 +2722,33 @@ class HyperspecTk(tk.Tk):
         if show_status and total_items > 5:
             self._set_status("Ready", duration_ms=500)
 
+    def _spec_line(self, key: Tuple[str, int], **style):
+        """Get persistent spectrum Line2D for key (created on first use)."""
+        line = self._spec_lines.get(key)
+        if line is None:
+            line, = self.ax_spec.plot([], [], **style)
+            self._spec_lines[key] = line
+        return line
+
+    def _sync_spec_lines(self, handles: List[Any]) -> None:
+        """Remove stale spectrum lines, rebuild legend and rescale x axis."""
+        ax = self.ax_spec
+        live = set(map(id, handles))
+        for key, line in list(self._spec_lines.items()):
+            if id(line) not in live:
+                line.remove()
+                del self._spec_lines[key]
+        
+        if handles:
+            ax.legend(handles=handles, loc='best')
+        elif ax.get_legend() is not None:
+            ax.get_legend().remove()
+        
+        # 横軸は表示中のスペクトルに合わせる（cla() 時と同じ自動スケール）
+        ax.relim(visible_only=True)
+        ax.set_autoscalex_on(True)
+        ax.autoscale_view(scalex=True, scaley=False)
+
     def _legend_for_point(self, p: Dict[str, Any]) -> str:
         """Generate legend text for point."""
         base = p["label"] if p["label"] else f'({p["x"]},{p["y"]})'
@@ -1911,11 +2787,10 @@ class HyperspecTk(tk.Tk):
         if event.button == 2:
             return
 
-        # Transform click coordinates from display space to data space
+        # x 軸は反転表示なので event.xdata はそのままデータ座標
         H, W, _ = self.data.shape
-        x_display = event.xdata
         y = int(round(event.ydata))
-        x = int(round(flip_x_from_display(x_display, W)))
+        x = int(round(event.xdata))
         
         if not (0 <= x < W and 0 <= y < H):
             return
@@ -1945,14 +2820,11 @@ class HyperspecTk(tk.Tk):
         if getattr(event, "button", None) == 3:
             if self._poly_temp_verts:
                 self._poly_temp_verts.pop()
-                if event.inaxes is self.ax_gray:
-                    self._update_gray_image()
-                else:
-                    self._update_rgb_image()
+                self._blit_temp_polygon(event.inaxes)
                 return
             
             if self._delete_polygon_near(x, y):
-                self._refresh_points_view()
+                self._request_update("tree")
             return
         
         # Add vertex
@@ -1968,6 +2840,7 @@ class HyperspecTk(tk.Tk):
                 "visible": True
             }
             self.polygons.append(pg)
+            self._items_changed()
             self._poly_temp_verts = []
             self._poly_drawing_axes = None
             
@@ -1976,17 +2849,14 @@ class HyperspecTk(tk.Tk):
             # ★ y軸自動調整を追加
             self._auto_adjust_y_range()
 
-            self._update_gray_image()
-            self._update_rgb_image()
+            self._update_overlays()
             self.spec_canvas.draw_idle()
             self.spec_canvas.flush_events()
             self._refresh_points_view(select_last=True)
+            return
         
-        # Update display
-        if event.inaxes is self.ax_gray:
-            self._update_gray_image()
-        else:
-            self._update_rgb_image()
+        # 頂点追加は描画中ポリゴンだけを blit（画像は再描画しない）
+        self._blit_temp_polygon(event.inaxes)
 
     def _add_point(self, x: int, y: int, axes) -> None:
         """Add new point and update display."""
@@ -2000,6 +2870,7 @@ class HyperspecTk(tk.Tk):
             "visible": True
         }
         self.points.append(p)
+        self._items_changed()
 
         sl, i_lo, i_hi = self._current_plot_slice_and_bounds()
         wl_plot = self.wavelengths[sl]
@@ -2011,8 +2882,12 @@ class HyperspecTk(tk.Tk):
         yplot = self._process_spectrum(ydisp)
 
         legend_text = self._legend_for_point(p)
-        self.ax_spec.plot(wl_plot, yplot, marker='o', lw=1.5, markersize=2.5,
-                          color=color, label=legend_text)
+        line = self._spec_line(("pt", id(p)), marker='o', lw=1.5, markersize=2.5)
+        line.set_data(wl_plot, yplot)
+        line.set_color(color)
+        line.set_label(legend_text)
+        self.ax_spec.relim(visible_only=True)
+        self.ax_spec.autoscale_view(scalex=True, scaley=False)
         
         lines = [ln for ln in self.ax_spec.get_lines()
                  if ln.get_label() and not str(ln.get_label()).startswith('_')]
@@ -2024,13 +2899,7 @@ class HyperspecTk(tk.Tk):
         
         self.spec_canvas.draw()
 
-        axes.plot(x, y, marker='+', color=color, markersize=10, markeredgewidth=1.8,
-                  zorder=3, clip_on=True)
-        
-        if axes is self.ax_gray:
-            self._update_gray_image()
-        else:
-            self._update_rgb_image()
+        self._update_overlays()
         
         self._refresh_points_view(select_last=True)
 
@@ -2039,7 +2908,7 @@ class HyperspecTk(tk.Tk):
     # =========================================================================
     def on_mode_change(self) -> None:
         """Handle mode change (Reflectance/Absorbance)."""
-        self._set_status("Recalculating spectra...")
+        self._set_status("Recalculating spectra...", flush=True)
         self._style_spec_axes()
         self._update_y_axis_label()
         self._redraw_spec_lines()
@@ -2049,7 +2918,7 @@ class HyperspecTk(tk.Tk):
 
     def on_noise_toggle(self, *_) -> None:
         """Handle denoise toggle."""
-        self._set_status("Applying denoise...")
+        self._set_status("Applying denoise...", flush=True)
         self._redraw_spec_lines()
         # ★ フィルタ変更時にY軸を自動調整
         self._auto_adjust_y_range()
@@ -2064,7 +2933,7 @@ class HyperspecTk(tk.Tk):
 
     def on_smooth_toggle(self, *_) -> None:
         """Handle smoothing toggle."""
-        self._set_status("Applying smoothing...")
+        self._set_status("Applying smoothing...", flush=True)
         self._redraw_spec_lines()
         # ★ フィルタ変更時にY軸を自動調整
         self._auto_adjust_y_range()
@@ -2072,14 +2941,14 @@ class HyperspecTk(tk.Tk):
 
     def on_snv_toggle(self, *_) -> None:
         """Handle SNV toggle."""
-        self._set_status("Applying SNV...")
+        self._set_status("Applying SNV...", flush=True)
         self._redraw_spec_lines()
         # ★ フィルタ変更時にY軸を自動調整
         self._auto_adjust_y_range()
         self._set_status("Ready", duration_ms=1000)
 
     def _apply_mode(self, y: np.ndarray) -> np.ndarray:
-        """Apply Reflectance/Absorbance conversion."""
+        """Apply Reflectance/Absorbance conversion (1D spectrum or 2D block of spectra)."""
         y = np.asarray(y, dtype=np.float32)
         mode = self.mode_var.get()
         
@@ -2087,21 +2956,32 @@ class HyperspecTk(tk.Tk):
             return y
         
         if mode == "Absorbance":
-            # Auto-detect scale: if max > 1.5, assume 16-bit scale
-            maxv = float(np.nanmax(y)) if y.size else 0.0
-            if np.isfinite(maxv) and maxv > 1.5:
-                R = y * (1.0 / 65535.0)
+            # Auto-detect scale per spectrum: if max > 1.5, assume 16-bit scale
+            if y.size:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN spectra
+                    maxv = np.nanmax(y, axis=-1, keepdims=True)
             else:
-                R = y
+                maxv = np.zeros(y.shape[:-1] + (1,), dtype=np.float32)
+            scale = np.where(np.isfinite(maxv) & (maxv > 1.5),
+                             np.float32(1.0 / 65535.0), np.float32(1.0)).astype(np.float32)
             
-            R = np.clip(R, 1e-8, 1.0)
-            A = -np.log10(R)
-            return A.astype(np.float32, copy=False)
+            if HAS_NUMEXPR:
+                # スケール・クリップ・log10 を1パスで評価
+                return numexpr.evaluate(
+                    "-log10(where(R * s < lo, lo, where(R * s > hi, hi, R * s)))",
+                    local_dict={"R": y, "s": scale, "lo": np.float32(1e-8), "hi": np.float32(1.0)})
+            
+            A = np.multiply(y, scale, dtype=np.float32)
+            np.clip(A, 1e-8, 1.0, out=A)
+            np.log10(A, out=A)
+            np.negative(A, out=A)
+            return A
         
         return y
 
     def _process_spectrum(self, y: np.ndarray) -> np.ndarray:
-        """Apply preprocessing to spectrum."""
+        """Apply preprocessing along the band (last) axis; accepts 1D or 2D (N, B) input."""
         y2 = np.asarray(y, dtype=np.float32, order="C")
         
         if getattr(self, "noise_var", None) and self.noise_var.get():
@@ -2113,27 +2993,35 @@ class HyperspecTk(tk.Tk):
         if getattr(self, "snv_var", None) and self.snv_var.get():
             y2 = self._apply_snv(y2)
         
-        return np.asarray(y2, dtype=np.float32, order="C", copy=False)
+        return np.asarray(y2, dtype=np.float32, order="C")
 
     def _apply_denoise(self, y: np.ndarray) -> np.ndarray:
         """Apply median filter denoising."""
-        n = len(y)
+        n = y.shape[-1]
         k = self._safe_window_length(n, base=self.med_window, min_win=MED_MIN_WIN)
         if k is None:
             return y
+        # フィルタは波長方向のみ（2Dブロックでは各行を独立に処理）
+        size = (1,) * (y.ndim - 1) + (k,)
         try:
-            return median_filter(y, size=k, mode='nearest')
+            out = median_filter(y, size=size, mode='nearest')
+            if y.ndim > 1 and y.dtype.kind == "f":
+                # NaN の並び順は 1D と多次元のフィルタで異なるため、NaN を含む行は 1D で処理し直す
+                rows, out_rows = y.reshape(-1, n), out.reshape(-1, n)
+                for i in np.flatnonzero(np.isnan(rows).any(axis=1)):
+                    out_rows[i] = median_filter(rows[i], size=k, mode='nearest')
+            return out
         except Exception:
             # Fallback: use medfilt (zero padding)
             try:
-                return medfilt(y, kernel_size=k)
+                return medfilt(y, kernel_size=size)
             except Exception:
                 return y
 
     def _apply_smoothing(self, y: np.ndarray) -> np.ndarray:
         """Apply Savitzky-Golay smoothing."""
         try:
-            n = len(y)
+            n = y.shape[-1]
             poly = SG_POLYORDER
             win = self._safe_window_length(n, base=self.sg_window, min_win=SG_MIN_WIN)
             
@@ -2146,11 +3034,20 @@ class HyperspecTk(tk.Tk):
                     win += 1
             
             # 微分次数の取得と適用
-            deriv_map = {"0th": 0, "1st": 1, "2nd": 2}
-            deriv = deriv_map.get(self.sg_deriv_var.get(), 0)
+            deriv = SG_DERIV_ORDERS.get(self.sg_deriv_var.get(), 0)
             
-            res = savgol_filter(y, window_length=win, polyorder=poly, 
-                               deriv=deriv, mode="interp")
+            edges = np.concatenate([y[..., :win], y[..., -win:]], axis=-1) if win <= n else None
+            if edges is not None and np.isfinite(edges).all():
+                # 事前計算した係数で一括畳み込み（端はmode="interp"と同じ多項式フィット）
+                conv, e_lo, e_hi = _sg_coeffs(win, poly, deriv)
+                res = convolve1d(np.asarray(y, dtype=np.float32), conv, axis=-1, mode="constant")
+                half = win // 2
+                if half:
+                    res[..., :half] = y[..., :win].astype(np.float64) @ e_lo
+                    res[..., n - half:] = y[..., -win:].astype(np.float64) @ e_hi
+            else:
+                res = savgol_filter(y, window_length=win, polyorder=poly, 
+                                   deriv=deriv, axis=-1, mode="interp")
             # 2次微分は表示のため符号を反転して返す
             if deriv == 2:
                 try:
@@ -2159,26 +3056,32 @@ class HyperspecTk(tk.Tk):
                     pass
             return res
         except Exception:
+            # 2Dブロックは行ごとに再試行（NaNを含む行だけがフォールバックする）
+            if y.ndim > 1:
+                return np.stack([self._apply_smoothing(row) for row in y])
             # Fallback to simple moving average (derivatives not supported)
-            n = len(y)
+            n = y.shape[-1]
             k = self._safe_window_length(n, base=7, min_win=3)
             if k is None:
                 return y
-            return np.convolve(y, np.ones(k) / k, mode="same")
+            return convolve1d(y, np.ones(k) / k, axis=-1, mode="constant", cval=0.0)
 
     def _apply_snv(self, y: np.ndarray) -> np.ndarray:
         """Apply Standard Normal Variate normalization."""
-        m = np.nanmean(y)
-        s = np.nanstd(y)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN spectra
+            m = np.nanmean(y, axis=-1, keepdims=True)
+            s = np.nanstd(y, axis=-1, keepdims=True)
         
-        if not np.isfinite(s) or s == 0:
-            return y - m
+        # s が 0 / 非有限のスペクトルは平均を引くだけ
+        s = np.where(np.isfinite(s) & (s != 0), s, 1.0)
         
         return (y - m) / s
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def _safe_window_length(n: int, base: int = 5, min_win: int = 3) -> Optional[int]:
-        """Calculate safe window length for filtering."""
+        """Calculate safe window length for filtering (memoized per (n, base, min_win))."""
         if n < min_win:
             return None
         
@@ -2209,12 +3112,13 @@ class HyperspecTk(tk.Tk):
         y_full = self._pt_raw_cache.get(key_raw)
         if y_full is None:
             if self._same_source(src, self.path_var.get()):
-                y_full = np.asarray(self.data[int(p["y"]), int(p["x"]), :]).squeeze().astype(float)
+                d = self.data
             else:
                 d, _ = self._get_hsi_for_source(src)
                 if d is None:
                     return None, None
-                y_full = d[int(p["y"]), int(p["x"]), :].astype(float)
+            # 処理系と同じ float32 で保持（バンド軸はすでに1次元）
+            y_full = np.ascontiguousarray(d[int(p["y"]), int(p["x"]), :], dtype=np.float32)
             self._pt_raw_cache[key_raw] = y_full
 
         # Check processed cache
@@ -2223,10 +3127,10 @@ class HyperspecTk(tk.Tk):
         y_proc = self._pt_proc_cache.get(key_proc)
         
         if y_proc is None:
-            y_slice = y_full[i_lo:i_hi + 1].astype(np.float32, copy=False)
-            y_disp = self._apply_mode(y_slice)
+            y_disp = self._apply_mode(y_full[i_lo:i_hi + 1])
             y_proc = self._process_spectrum(y_disp)
             self._pt_proc_cache[key_proc] = y_proc
+            self._pt_proc_keys_by_raw.setdefault(key_raw, set()).add(key_proc)
 
         wl_slice = self.wavelengths[i_lo:i_hi + 1]
         return wl_slice, y_proc
@@ -2243,10 +3147,11 @@ class HyperspecTk(tk.Tk):
         if d is None or wl is None or wl.size == 0:
             return None
 
-        k_base = (src, self._normalize_verts(pg.get("verts") or []))
+        k_base = self._polygon_key(pg)
         flags = self._proc_flags()
         # キャッシュキーに近似モード・ダウンサンプリング閾値を含める
-        key = k_base + (flags, int(i_lo), int(i_hi), bool(self.poly_approx_mode), int(self.poly_downsample_threshold))
+        key = k_base + (flags, int(i_lo), int(i_hi), bool(self.poly_approx_mode), int(self.poly_downsample_threshold),
+                        bool(self.poly_fast_stats))
         
         cached = self._poly_proc_cache.get(key)
         if cached is not None:
@@ -2266,10 +3171,13 @@ class HyperspecTk(tk.Tk):
             np.random.seed(42)  # 再現性のため
             idx = np.random.choice(idx, self.poly_downsample_threshold, replace=False)
         
-        D = d.reshape(-1, B)[idx][:, s].astype(np.float32, copy=False)
-
+        # ★ スケッチ（Fast stats）：固定シードの一様サンプル、メモリ順に並べて読む
+        if self.poly_fast_stats and idx.size > SKETCH_THRESHOLD:
+            idx = np.sort(np.random.default_rng(0).choice(idx, size=SKETCH_SIZE, replace=False))
+        
         # ★ 近似モード：平均→処理
         if self.poly_approx_mode:
+            D = _gather_pixels(d, idx, s).astype(np.float32, copy=False)
             mean_raw = np.nanmean(D, axis=0)
             std_raw = np.nanstd(D, axis=0, ddof=0)
             
@@ -2282,19 +3190,21 @@ class HyperspecTk(tk.Tk):
             out = (self.wavelengths[s], mean_proc, std_proc, n_pixels)
         else:
             # ★ 厳密モード：各ピクセルを処理→平均
-            def _proc(y):
-                return self._process_spectrum(self._apply_mode(y))
-            
-            try:
-                Y = np.apply_along_axis(_proc, 1, D)
-            except Exception:
-                Y = np.vstack([_proc(row) for row in D])
-
-            mean = np.nanmean(Y, axis=0)
-            std = np.nanstd(Y, axis=0, ddof=0)
+            if HAS_NUMBA and not self.noise_var.get() and not self.smooth_var.get():
+                # 吸光度変換・SNV・平均/標準偏差を1パスで計算（融合カーネル）
+                mean, std = _poly_stats_kernel(
+                    d, np.ascontiguousarray(idx, dtype=np.int64), int(i_lo), int(i_hi),
+                    self.mode_var.get() == "Absorbance", bool(self.snv_var.get()))
+            else:
+                # 全ピクセルを (N, B) ブロックとして一括処理
+                D = _gather_pixels(d, idx, s).astype(np.float32, copy=False)
+                Y = self._process_spectrum(self._apply_mode(D))
+                mean = np.nanmean(Y, axis=0)
+                std = np.nanstd(Y, axis=0, ddof=0)
             out = (self.wavelengths[s], mean, std, n_pixels)
         
         self._poly_proc_cache[key] = out
+        self._poly_proc_keys_by_base.setdefault(k_base, set()).add(key)
         return out
 
     def _get_polygon_idx(self, pg: Dict[str, Any], d: np.ndarray) -> np.ndarray:
@@ -2304,19 +3214,49 @@ class HyperspecTk(tk.Tk):
         
         if idx is None:
             H, W, _ = d.shape
-            yy, xx = np.mgrid[0:H, 0:W]
-            pts = np.column_stack([xx.ravel(), yy.ravel()])
-            mask = Path([*k[1]]).contains_points(pts).reshape(H, W)
-            idx = np.flatnonzero(mask)
+            # 外接矩形（画像内にクリップ）の画素だけを判定する
+            vs = k[1]
+            if HAS_NUMBA:
+                idx = _rasterize_polygon(np.array(vs, dtype=np.float64).reshape(-1, 2), H, W)
+                self._poly_idx_cache[k] = idx
+                return idx
+            xs, ys = zip(*vs) if vs else ((), ())
+            x0, x1 = max(0, min(xs, default=0)), min(W, max(xs, default=-1) + 1)
+            y0, y1 = max(0, min(ys, default=0)), min(H, max(ys, default=-1) + 1)
+            if x1 <= x0 or y1 <= y0:
+                idx = np.empty(0, dtype=np.intp)
+            else:
+                yy, xx = np.mgrid[y0:y1, x0:x1]
+                pts = np.column_stack([xx.ravel(), yy.ravel()])
+                mask_local = self._poly_path(pg).contains_points(pts).reshape(y1 - y0, x1 - x0)
+                ys_local, xs_local = np.nonzero(mask_local)
+                idx = (ys_local + y0) * W + (xs_local + x0)
             self._poly_idx_cache[k] = idx
         
         return idx
 
+    def _poly_cached(self, pg: Dict[str, Any], name: str, build, *extra):
+        """
+        Get per-polygon derived data cached on the polygon dict.
+        
+        The entry is rebuilt when the verts object or the extra arguments change
+        (verts are replaced, never mutated, so identity is a sufficient check).
+        """
+        vs = pg.get("verts") or ()
+        c = pg.get(name)
+        if c is None or c[0] is not vs or c[1] != extra:
+            c = (vs, extra, build(vs, *extra))
+            pg[name] = c
+        return c[2]
+
+    def _poly_path(self, pg: Dict[str, Any]) -> Path:
+        """Get matplotlib Path of polygon (data space, cached)."""
+        return self._poly_cached(pg, "_path_cache", lambda vs: Path(self._normalize_verts(vs)))
+
     def _polygon_key(self, pg: Dict[str, Any]) -> Tuple[str, Tuple[Tuple[int, int], ...]]:
-        """Generate cache key for polygon."""
+        """Generate cache key for polygon (source, normalized verts cached on the dict)."""
         src = str(pg.get("source", ""))
-        verts = tuple((int(x), int(y)) for x, y in (pg.get("verts") or []))
-        return (src, verts)
+        return (src, self._poly_cached(pg, "_vnorm", self._normalize_verts))
 
     def _get_hsi_for_source(self, src_path: str) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
         """Load HSI data from source path with caching."""
@@ -2334,7 +3274,10 @@ class HyperspecTk(tk.Tk):
         
         try:
             img = spectral.open_image(src_path)
-            data = np.asarray(img.load())
+            try:
+                data = img.open_memmap(writable=False)  # 全体を読み込まずメモリマップ
+            except Exception:
+                data = np.asarray(img.load())
             
             if data.ndim == 2:
                 data = data[:, :, None]
@@ -2351,18 +3294,41 @@ class HyperspecTk(tk.Tk):
     def _clear_all_caches(self) -> None:
         """Clear all caches."""
         self._pt_raw_cache.clear()
-        self._pt_proc_cache.clear()
         self._poly_idx_cache.clear()
+        self._src_exists_cache.clear()
+        self._clear_proc_caches()
+
+    def _clear_proc_caches(self) -> None:
+        """Clear processed-spectrum caches (and their reverse indices)."""
+        self._pt_proc_cache.clear()
         self._poly_proc_cache.clear()
+        self._pt_proc_keys_by_raw.clear()
+        self._poly_proc_keys_by_base.clear()
+
+    def _on_pt_proc_evict(self, key: Tuple, _value) -> None:
+        """Drop an LRU-evicted processed point key from its reverse index."""
+        key_raw = key[:3]
+        keys = self._pt_proc_keys_by_raw.get(key_raw)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._pt_proc_keys_by_raw[key_raw]
+
+    def _on_poly_proc_evict(self, key: Tuple, _value) -> None:
+        """Drop an LRU-evicted processed polygon key from its reverse index."""
+        key_base = key[:2]
+        keys = self._poly_proc_keys_by_base.get(key_base)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._poly_proc_keys_by_base[key_base]
 
     def _invalidate_point_cache(self, src: str, x: int, y: int) -> None:
         """Invalidate cache for specific point."""
         key_raw = (str(src), int(x), int(y))
         self._pt_raw_cache.pop(key_raw, None)
         
-        to_del = [k for k in self._pt_proc_cache.keys()
-                  if isinstance(k, tuple) and len(k) >= 3 and k[0:3] == key_raw]
-        for k in to_del:
+        for k in self._pt_proc_keys_by_raw.pop(key_raw, ()):
             self._pt_proc_cache.pop(k, None)
 
     def _invalidate_polygon_cache(self, src: str, verts: Sequence[Tuple[int, int]]) -> None:
@@ -2370,9 +3336,7 @@ class HyperspecTk(tk.Tk):
         key_base = (str(src), self._normalize_verts(verts))
         self._poly_idx_cache.pop(key_base, None)
         
-        to_del = [k for k in self._poly_proc_cache.keys()
-                  if isinstance(k, tuple) and len(k) >= 3 and k[0:2] == key_base]
-        for k in to_del:
+        for k in self._poly_proc_keys_by_base.pop(key_base, ()):
             self._poly_proc_cache.pop(k, None)
 
     # =========================================================================
@@ -2381,41 +3345,36 @@ class HyperspecTk(tk.Tk):
     def on_delete_last_marker(self, *_) -> None:
         """Delete last added marker."""
         # Skip if inline editing is active
-        if hasattr(self, "_tv_inline_entry") and self._tv_inline_entry is not None:
-            try:
-                if self._tv_inline_entry.winfo_exists():
-                    return  # Don't delete marker while editing label
-            except Exception:
-                pass
+        if self._tv_inline_iid is not None:
+            return  # Don't delete marker while editing label
         
         if not self.points:
             return
         
         p = self.points.pop()
+        self._items_changed()
         self._invalidate_point_cache(p.get("source", self.path_var.get()), int(p["x"]), int(p["y"]))
-        self._redraw_spec_lines()
-        self._update_gray_image()
-        self._update_rgb_image()
-        self._refresh_points_view()
+        self._request_update("spec", "overlay", "tree")
 
     def reset_spectra(self) -> None:
         """Reset all spectra and markers."""
         self._clear_all_caches()
         
         self.ax_spec.cla()
+        self._spec_lines.clear()
+        self._spec_fills = []
         self._style_spec_axes()
         self.spec_canvas.draw()
         
         self.points.clear()
         self.polygons.clear()
+        self._items_changed()
         self._poly_temp_verts = []
         self._poly_drawing_axes = None
         
-        self._pt_color_idx = 0
-        self._pg_color_idx = 0
+        self._reset_color_cycles(0, 0)
         
-        self._update_gray_image()
-        self._update_rgb_image()
+        self._update_overlays()
         
         self._refresh_points_view()
 
@@ -2426,19 +3385,18 @@ class HyperspecTk(tk.Tk):
         if not self.points:
             return False
         
-        pts = np.array([(p["x"], p["y"]) for p in self.points])
-        d = np.sqrt((pts[:, 0] - x) ** 2 + (pts[:, 1] - y) ** 2)
-        i = int(np.argmin(d))
+        # SoA ミラーの座標で平方距離を比較（sqrt 不要）
+        st = self._pt_store.sync(self.points, self._src_id)
+        dx = st.x.astype(np.int64) - x
+        dy = st.y.astype(np.int64) - y
+        d2 = dx * dx + dy * dy
+        i = int(np.argmin(d2))
         
-        if d[i] <= radius:
+        if d2[i] <= radius * radius:
             p = self.points.pop(i)
-            self._redraw_spec_lines()
+            self._items_changed()
             self._invalidate_point_cache(p.get("source", self.path_var.get()), int(p["x"]), int(p["y"]))
-            self._update_gray_image()
-            self._update_rgb_image()
-            
-            self._refresh_points_view()
-            
+            self._request_update("spec", "overlay", "tree")
             return True
         
         return False
@@ -2450,76 +3408,48 @@ class HyperspecTk(tk.Tk):
         
         rad = radius if radius is not None else DELETE_RADIUS_PX
         rad2 = rad * 1.5
-
-        def _pt_seg_dist(px, py, x1, y1, x2, y2):
-            vx, vy = x2 - x1, y2 - y1
-            wx, wy = px - x1, py - y1
-            denom = vx * vx + vy * vy
-            
-            if denom <= 1e-12:
-                dx, dy = px - x1, py - y1
-                return (dx * dx + dy * dy) ** 0.5
-            
-            t = max(0.0, min(1.0, (wx * vx + wy * vy) / denom))
-            nx, ny = x1 + t * vx, y1 + t * vy
-            dx, dy = px - nx, py - ny
-            return (dx * dx + dy * dy) ** 0.5
-
-        # Check if click is inside polygon
-        for i, pg in enumerate(self.polygons):
-            vs = pg.get("verts") or []
-            if len(vs) < 3:
-                continue
-            
-            if Path(vs).contains_point((x, y)):
-                pg = self.polygons.pop(i)
-                self._invalidate_polygon_cache(pg.get("source", self.path_var.get()), pg.get("verts", []))
-                self._redraw_spec_lines()
-                self._update_gray_image()
-                self._update_rgb_image()
-                return True
-
-        # Check if click is near vertices
-        for i, pg in enumerate(self.polygons):
-            vs = pg.get("verts") or []
-            if len(vs) < 3:
-                continue
-            
-            for (vx, vy) in vs:
-                if (vx - x) ** 2 + (vy - y) ** 2 <= rad * rad:
-                    pg = self.polygons.pop(i)
-                    self._invalidate_polygon_cache(pg.get("source", self.path_var.get()), pg.get("verts", []))
-                    self._redraw_spec_lines()
-                    self._update_gray_image()
-                    self._update_rgb_image()
-                    return True
-            
-            # Check if click is near edges
-            for (x1, y1), (x2, y2) in zip(vs, vs[1:] + vs[:1]):
-                if _pt_seg_dist(x, y, x1, y1, x2, y2) <= rad2:
-                    pg = self.polygons.pop(i)
-                    self._invalidate_polygon_cache(pg.get("source", self.path_var.get()), pg.get("verts", []))
-                    self._redraw_spec_lines()
-                    self._update_gray_image()
-                    self._update_rgb_image()
-                    return True
         
-        return False
+        # 全ポリゴンをパディング済み配列で一括判定（bboxで候補を先に絞る）
+        st = self._pg_store.sync(self.polygons, self._src_id)
+        bb = st.bbox
+        cand = np.flatnonzero((st.nverts >= 3)
+                              & (bb[:, 0] - rad2 <= x) & (x <= bb[:, 2] + rad2)
+                              & (bb[:, 1] - rad2 <= y) & (y <= bb[:, 3] + rad2))
+        if cand.size == 0:
+            return False
+        rings = st.rings[cand]
+        
+        # Check if click is inside polygon
+        hit = _rings_contain(rings, x, y)
+        if not hit.any():
+            # Check if click is near vertices / edges（平方距離で比較）
+            near_v = (((rings - (x, y)) ** 2).sum(axis=2) <= rad * rad).any(axis=1)
+            hit = near_v | (_rings_min_dist2(rings, x, y) <= rad2 * rad2)
+            if not hit.any():
+                return False
+        
+        pg = self.polygons.pop(int(cand[np.argmax(hit)]))
+        self._items_changed()
+        self._invalidate_polygon_cache(pg.get("source", self.path_var.get()), pg.get("verts", []))
+        self._request_update("spec", "overlay")
+        return True
 
     # =========================================================================
     # COLOR MANAGEMENT
     # =========================================================================
+    def _reset_color_cycles(self, pt_start: int, pg_start: int) -> None:
+        """Restart point/polygon palette cycles at the given positions."""
+        k, j = pt_start % 10, pg_start % 10
+        self._pt_color_iter = itertools.cycle(self._palette10[k:] + self._palette10[:k])
+        self._pg_color_iter = itertools.cycle(self._palette10[j:] + self._palette10[:j])
+
     def _next_point_color(self):
         """Get next color for point."""
-        c = self._palette10[self._pt_color_idx % 10]
-        self._pt_color_idx = (self._pt_color_idx + 1) % 10
-        return c
+        return next(self._pt_color_iter)
 
     def _next_polygon_color(self):
         """Get next color for polygon."""
-        c = self._palette10[self._pg_color_idx % 10]
-        self._pg_color_idx = (self._pg_color_idx + 1) % 10
-        return c
+        return next(self._pg_color_iter)
 
     # =========================================================================
     # POINTS LIST MANAGEMENT (TREEVIEW)
@@ -2578,43 +3508,81 @@ class HyperspecTk(tk.Tk):
         except Exception:
             pass
 
-    def _refresh_points_view(self, *, select_last: bool = False) -> None:
-        """Refresh points list display."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Add points
-        for i, p in enumerate(self.points):
-            pid = f"sp{i+1:04d}"
-            src = str(p.get("source", "")) if p.get("source", "") is not None else ""
-            base = os.path.basename(src) if src else "-"
-            
-            if src and not self._source_exists(src):
-                base = f"{base} [MISSING]"
-            
-            view_txt = "✓" if p.get("visible", True) else ""
-            self.tree.insert("", "end", iid=pid,
-                             values=(pid, p["label"], view_txt, p["x"], p["y"], base))
+    def _tree_row_values(self, iid: str, src_col: Optional[Dict[str, str]] = None) -> Optional[tuple]:
+        """Build Treeview values for a row id ("spNNNN" / "pgNNNN"), or None if out of range."""
+        try:
+            i = int(iid[2:]) - 1
+        except Exception:
+            return None
         
-        # Add polygons
-        for j, pg in enumerate(self.polygons):
-            iid = f"pg{j+1:04d}"
-            vs = pg.get("verts") or []
-            
-            if len(vs) >= 1:
-                cx = int(round(sum(v[0] for v in vs) / len(vs)))
-                cy = int(round(sum(v[1] for v in vs) / len(vs)))
+        if iid.startswith("sp") and 0 <= i < len(self.points):
+            p = self.points[i]
+            cx, cy = p["x"], p["y"]
+        elif iid.startswith("pg") and 0 <= i < len(self.polygons):
+            p = self.polygons[i]
+            st = self._pg_store.sync(self.polygons, self._src_id)
+            if st.nverts[i] >= 1:
+                cx, cy = int(st.centroid[i, 0]), int(st.centroid[i, 1])
             else:
                 cx, cy = "", ""
-            
-            src = str(pg.get("source", "")) if pg.get("source", "") is not None else ""
+        else:
+            return None
+        
+        src = str(p.get("source", "")) if p.get("source", "") is not None else ""
+        # ソース列の文字列はソースごとに1回だけ作る（src_col はリフレッシュ単位のメモ）
+        base = src_col.get(src) if src_col is not None else None
+        if base is None:
             base = os.path.basename(src) if src else "-"
-            
             if src and not self._source_exists(src):
                 base = f"{base} [MISSING]"
-            
-            view_txt = "✓" if pg.get("visible", True) else ""
-            self.tree.insert("", "end", iid=iid, values=(iid, pg.get("label", ""), view_txt, cx, cy, base))
+            if src_col is not None:
+                src_col[src] = base
+        
+        view_txt = "✓" if p.get("visible", True) else ""
+        return (iid, p.get("label", ""), view_txt, cx, cy, base)
+
+    def _patch_tree_row(self, iid: str) -> None:
+        """Update a single Treeview row in place (no full refresh)."""
+        vals = self._tree_row_values(iid)
+        if vals is None or iid not in self._tree_row_state:
+            self._refresh_points_view()
+            return
+        if self._tree_row_state[iid] != vals:
+            self.tree.item(iid, values=vals)
+            self._tree_row_state[iid] = vals
+
+    def _refresh_points_view(self, *, select_last: bool = False) -> None:
+        """Refresh points list display (diff against the rows currently shown)."""
+        src_col: Dict[str, str] = {}
+        new_rows: Dict[str, tuple] = {}
+        new_items: Dict[str, dict] = {}
+        for iid, it in itertools.chain(
+                ((f"sp{i+1:04d}", p) for i, p in enumerate(self.points)),
+                ((f"pg{j+1:04d}", pg) for j, pg in enumerate(self.polygons))):
+            new_rows[iid] = self._tree_row_values(iid, src_col)
+            new_items[iid] = it
+        
+        old_rows = self._tree_row_state
+        to_delete = [iid for iid in old_rows if iid not in new_rows]
+        if to_delete:
+            self.tree.delete(*to_delete)
+        
+        # 削除などで別の項目が同じ行IDに来た行は選択を外す（古い選択のまま別の項目を操作しないように）
+        old_items = self._tree_row_item
+        moved = [iid for iid, it in new_items.items()
+                 if iid in old_items and old_items[iid] is not it]
+        if moved:
+            self.tree.selection_remove(*moved)
+        self._tree_row_item = new_items
+        
+        # 行IDは位置に対応するため、残った行の相対順序は保たれる → 新規行は最終位置に挿入
+        for pos, (iid, vals) in enumerate(new_rows.items()):
+            old = old_rows.get(iid)
+            if old is None:
+                self.tree.insert("", pos, iid=iid, values=vals)
+            elif old != vals:
+                self.tree.item(iid, values=vals)
+        self._tree_row_state = new_rows
 
         if select_last:
             if self.points:
@@ -2643,7 +3611,9 @@ class HyperspecTk(tk.Tk):
                 return
             
             if 0 <= idx < len(self.points):
-                self.points[idx]["visible"] = not bool(self.points[idx].get("visible", True))
+                vis = not bool(self.points[idx].get("visible", True))
+                self.points[idx]["visible"] = vis
+                self._pt_store.set_visible(idx, vis)
         elif iid.startswith("pg"):
             try:
                 idx = int(iid[2:]) - 1
@@ -2651,14 +3621,14 @@ class HyperspecTk(tk.Tk):
                 return
             
             if 0 <= idx < len(self.polygons):
-                self.polygons[idx]["visible"] = not bool(self.polygons[idx].get("visible", True))
+                vis = not bool(self.polygons[idx].get("visible", True))
+                self.polygons[idx]["visible"] = vis
+                self._pg_store.set_visible(idx, vis)
         else:
             return
 
-        self._refresh_points_view()
-        self._redraw_spec_lines()
-        self._update_gray_image()
-        self._update_rgb_image()
+        self._patch_tree_row(iid)
+        self._request_update("spec", "overlay")
 
     def _on_tree_double_click_inline(self, event) -> None:
         """Handle double-click on LABEL column for inline editing."""
@@ -2711,82 +3681,54 @@ class HyperspecTk(tk.Tk):
         else:
             return
 
-        # Close existing editor
-        if hasattr(self, "_tv_inline_entry") and self._tv_inline_entry is not None:
-            try:
-                self._tv_inline_entry.destroy()
-            except Exception:
-                pass
-            self._tv_inline_entry = None
+        # Close existing editor (without committing)
+        self._cancel_inline_edit()
+
+        e = self._tv_inline_entry
+        if e is None:
+            e = self._tv_inline_entry = ttk.Entry(self.tree)
+            e.bind("<Return>", self._commit_inline_edit)
+            e.bind("<KP_Enter>", self._commit_inline_edit)
+            e.bind("<Escape>", self._cancel_inline_edit)
+            e.bind("<FocusOut>", self._commit_inline_edit)
 
-        # Create inline entry
-        e = ttk.Entry(self.tree)
+            self.tree.bind("<<TreeviewSelect>>", self._commit_inline_edit, add="+")
+            # リサイズ・スクロールは連続で来るので 50ms デバウンス
+            self.tree.bind("<Configure>", lambda _ev: self._debounce("inline_commit", self._commit_inline_edit, delay_ms=50), add="+")
+            self.tree.bind("<MouseWheel>", lambda _ev: self._debounce("inline_commit", self._commit_inline_edit, delay_ms=50), add="+")
+
+        e.delete(0, tk.END)
         e.insert(0, cur_label)
+        e.place(x=x, y=y, width=w, height=h)
         e.select_range(0, tk.END)
         e.focus_set()
-        e.place(x=x, y=y, width=w, height=h)
-
-        self._tv_inline_entry = e
         self._tv_inline_iid = iid
 
-        def _commit(*_):
-            # Check if entry still exists
-            if not self._tv_inline_entry or not self._tv_inline_entry.winfo_exists():
-                self._tv_inline_entry = None
-                self._tv_inline_iid = None
-                return
-            
-            try:
-                new_label = self._tv_inline_entry.get().strip()
-            except Exception:
-                # Entry already destroyed
-                self._tv_inline_entry = None
-                self._tv_inline_iid = None
-                return
-            
-            if self._tv_inline_iid and self._tv_inline_iid.startswith("sp"):
-                try:
-                    i = int(self._tv_inline_iid[2:]) - 1
-                except Exception:
-                    i = -1
-                if 0 <= i < len(self.points):
-                    self.points[i]["label"] = new_label
-            elif self._tv_inline_iid and self._tv_inline_iid.startswith("pg"):
-                try:
-                    i = int(self._tv_inline_iid[2:]) - 1
-                except Exception:
-                    i = -1
-                if 0 <= i < len(self.polygons):
-                    self.polygons[i]["label"] = new_label
-            
-            try:
-                if self._tv_inline_entry and self._tv_inline_entry.winfo_exists():
-                    self._tv_inline_entry.destroy()
-            except Exception:
-                pass
-            
-            self._tv_inline_entry = None
-            self._tv_inline_iid = None
-            self._refresh_points_view()
-            self._redraw_spec_lines()
-
-        def _cancel(*_):
-            try:
-                if self._tv_inline_entry and self._tv_inline_entry.winfo_exists():
-                    self._tv_inline_entry.destroy()
-            except Exception:
-                pass
-            self._tv_inline_entry = None
-            self._tv_inline_iid = None
+    def _commit_inline_edit(self, *_) -> None:
+        """Apply the inline editor's text to its row and hide the editor."""
+        iid = self._tv_inline_iid
+        if iid is None:
+            return
+        new_label = self._tv_inline_entry.get().strip()
+        self._cancel_inline_edit()
 
-        e.bind("<Return>", _commit)
-        e.bind("<KP_Enter>", _commit)
-        e.bind("<Escape>", _cancel)
-        e.bind("<FocusOut>", _commit)
+        try:
+            i = int(iid[2:]) - 1
+        except Exception:
+            return
+        items = self.points if iid.startswith("sp") else self.polygons if iid.startswith("pg") else []
+        if 0 <= i < len(items):
+            items[i]["label"] = new_label
+        
+        self._patch_tree_row(iid)
+        self._request_update("spec")
 
-        self.tree.bind("<<TreeviewSelect>>", lambda _ev: _commit(), add="+")
-        self.tree.bind("<Configure>", lambda _ev: _commit(), add="+")
-        self.tree.bind("<MouseWheel>", lambda _ev: _commit(), add="+")
+    def _cancel_inline_edit(self, *_) -> None:
+        """Hide the inline editor without applying it."""
+        if self._tv_inline_iid is None:
+            return
+        self._tv_inline_iid = None  # 先に外す（place_forget の FocusOut で再コミットしない）
+        self._tv_inline_entry.place_forget()
 
     def _get_selected_index(self) -> Optional[Tuple[str, int]]:
         """Get selected item type and index."""
@@ -2822,15 +3764,14 @@ class HyperspecTk(tk.Tk):
         
         if kind == "point":
             p = self.points.pop(idx)
+            self._items_changed()
             self._invalidate_point_cache(p.get("source", self.path_var.get()), int(p["x"]), int(p["y"]))
         elif kind == "poly":
             pg = self.polygons.pop(idx)
+            self._items_changed()
             self._invalidate_polygon_cache(pg.get("source", self.path_var.get()), pg.get("verts", []))
         
-        self._redraw_spec_lines()
-        self._update_gray_image()
-        self._update_rgb_image()
-        self._refresh_points_view()
+        self._request_update("spec", "overlay", "tree")
 
     def _reset_colors(self) -> None:
         """Reset all point and polygon colors from palette start."""
@@ -2838,20 +3779,17 @@ class HyperspecTk(tk.Tk):
             return
         
         # Reassign colors from start
-        for i, p in enumerate(self.points):
-            p["color"] = self._palette10[i % 10]
-        for j, pg in enumerate(self.polygons):
-            pg["color"] = self._palette10[j % 10]
+        for p, c in zip(self.points, itertools.cycle(self._palette10)):
+            p["color"] = c
+        for pg, c in zip(self.polygons, itertools.cycle(self._palette10)):
+            pg["color"] = c
+        self._items_changed()
         
         # Reset color indices
-        self._pt_color_idx = len(self.points) % 10
-        self._pg_color_idx = len(self.polygons) % 10
+        self._reset_color_cycles(len(self.points), len(self.polygons))
         
         # Refresh display
-        self._refresh_points_view()
-        self._redraw_spec_lines()
-        self._update_gray_image()
-        self._update_rgb_image()
+        self._request_update("tree", "spec", "overlay")
         
         # Show status
         total = len(self.points) + len(self.polygons)
@@ -2876,8 +3814,7 @@ class HyperspecTk(tk.Tk):
             self._poly_temp_verts = []
             self._poly_drawing_axes = None
         
-        self._update_gray_image()
-        self._update_rgb_image()
+        self._update_overlays()
 
     # =========================================================================
     # EXPORT AND SAVE
@@ -2911,9 +3848,9 @@ class HyperspecTk(tk.Tk):
         label_items: List[str] = []
         src_items: List[str] = []
 
-        # Export points
+        # Export points（ソースごとに1回の補間）
+        cols.extend(self._raw_spectra_on_master(self.points, wl).T)
         for i, p in enumerate(self.points):
-            cols.append(self._get_raw_spectrum_on_master(p, wl))
             ids.append(f"sp{i+1:04d}")
             
             lbl = p.get("label") or f"({p.get('x')},{p.get('y')})"
@@ -2923,15 +3860,24 @@ class HyperspecTk(tk.Tk):
             src_base = os.path.basename(src_full) if src_full else ""
             src_items.append(f"{src_base}@x={p.get('x','')};y={p.get('y','')}")
 
-        # Export polygons
+        # Export polygons（同じソースの mean/std 列はまとめて1回で補間）
+        stats: List[Tuple[int, Dict[str, Any], np.ndarray, np.ndarray]] = []
+        groups: Dict[str, Tuple[np.ndarray, List[int]]] = {}
         for j, pg in enumerate(self.polygons):
             w_src, m_src, s_src, N = self._compute_polygon_raw_stats(pg)
             if w_src is None:
                 continue
-            
-            m_out = np.interp(wl, w_src, m_src, left=np.nan, right=np.nan)
-            s_out = np.interp(wl, w_src, s_src, left=np.nan, right=np.nan)
-            
+            groups.setdefault(str(pg.get("source", "")), (w_src, []))[1].append(len(stats))
+            stats.append((j, pg, m_src, s_src))
+        
+        out_cols: List[Optional[Tuple[np.ndarray, np.ndarray]]] = [None] * len(stats)
+        for w_src, ks in groups.values():
+            block = _interp_columns(wl, w_src, np.column_stack(
+                [c for k in ks for c in (stats[k][2], stats[k][3])]))
+            for n, k in enumerate(ks):
+                out_cols[k] = (block[:, 2 * n], block[:, 2 * n + 1])
+        
+        for (j, pg, _, _), (m_out, s_out) in zip(stats, out_cols):
             cols.append(m_out)
             ids.append(f"pg{j+1:04d}_mean")
             cols.append(s_out)
@@ -2952,42 +3898,53 @@ class HyperspecTk(tk.Tk):
         
         messagebox.showinfo("Export CSV", f"Saved (spectra only): {os.path.basename(path)}")
 
-    def _get_raw_spectrum_on_master(self, p: Dict[str, Any], wl_master: np.ndarray) -> np.ndarray:
-        """Get raw spectrum interpolated to master wavelength grid."""
+    def _raw_spectra_on_master(self, pts: Sequence[Dict[str, Any]], wl_master: np.ndarray) -> np.ndarray:
+        """Get raw spectra of points interpolated to master wavelength grid, as a (B, n) block."""
         wl_master = np.asarray(wl_master).reshape(-1)
-        B = wl_master.shape[0]
+        out = np.full((wl_master.shape[0], len(pts)), np.nan)
         
-        if self.data is None or self.wavelengths is None or B == 0:
-            return np.full((B,), np.nan, dtype=float)
+        if self.data is None or self.wavelengths is None or out.size == 0:
+            return out
 
         cur_src = str(self.path_var.get())
-        src = str(p.get("source", "")) if p.get("source", "") is not None else ""
-
-        if src == cur_src:
-            H, W, _ = self.data.shape
-            x0 = int(np.clip(p["x"], 0, W - 1))
-            y0 = int(np.clip(p["y"], 0, H - 1))
-            return np.asarray(self.data[y0, x0, :]).astype(float).reshape(-1)
-
-        d, wl_src = self._get_hsi_for_source(src)
-        if d is None or wl_src is None or wl_src.size == 0:
-            return np.full((B,), np.nan, dtype=float)
+        groups: Dict[str, List[int]] = {}
+        for i, p in enumerate(pts):
+            src = str(p.get("source", "")) if p.get("source", "") is not None else ""
+            groups.setdefault(src, []).append(i)
 
-        Hs, Ws, _ = d.shape
-        x0 = int(np.clip(p["x"], 0, Ws - 1))
-        y0 = int(np.clip(p["y"], 0, Hs - 1))
-        y_src = np.asarray(d[y0, x0, :]).astype(float).reshape(-1)
+        for src, ii in groups.items():
+            if src == cur_src:
+                d, wl_src = self.data, None
+            else:
+                d, wl_src = self._get_hsi_for_source(src)
+                if d is None or wl_src is None or wl_src.size == 0:
+                    continue
+            
+            Hs, Ws, _ = d.shape
+            xs = np.clip([pts[i]["x"] for i in ii], 0, Ws - 1)
+            ys = np.clip([pts[i]["y"] for i in ii], 0, Hs - 1)
+            Y = np.asarray(d[ys, xs, :]).astype(float)
+            
+            if wl_src is None:
+                out[:, ii] = Y.T
+            else:
+                uniq_wl, sel = self._wl_grid(src, wl_src)
+                out[:, ii] = _interp_columns(wl_master, uniq_wl, Y[:, sel].T)
+        return out
 
-        wl_src = np.asarray(wl_src, dtype=float).reshape(-1)
-        order = np.argsort(wl_src)
-        wl_sorted = wl_src[order]
-        y_sorted = y_src[order]
-        
-        uniq_wl, idx_start = np.unique(wl_sorted, return_index=True)
-        y_uniq = y_sorted[idx_start]
-        
-        y_out = np.interp(wl_master, uniq_wl, y_uniq, left=np.nan, right=np.nan)
-        return y_out
+    def _wl_grid(self, src: str, wl_src: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sorted unique wavelengths of a source and the band indices selecting them
+        (cached per source; rebuilt when the source's wavelength array is reloaded).
+        """
+        c = self._wl_grid_cache.get(src)
+        if c is None or c[0] is not wl_src:
+            wl = np.asarray(wl_src, dtype=float).reshape(-1)
+            order = np.argsort(wl)
+            uniq_wl, idx_start = np.unique(wl[order], return_index=True)
+            c = (wl_src, uniq_wl, order[idx_start])
+            self._wl_grid_cache[src] = c
+        return c[1], c[2]
 
     def _compute_polygon_raw_stats(self, pg: Dict[str, Any]) -> Tuple[Optional[np.ndarray], Optional[np.ndarray], Optional[np.ndarray], int]:
         """Compute raw statistics for polygon."""
@@ -3002,34 +3959,27 @@ class HyperspecTk(tk.Tk):
             if d is None or wl is None or wl.size == 0:
                 return None, None, None, 0
         
-        H, W, B = d.shape
         vs = pg.get("verts") or []
         
         if len(vs) < 3:
             return None, None, None, 0
         
-        yy, xx = np.mgrid[0:H, 0:W]
-        pts = np.column_stack([xx.ravel(), yy.ravel()])
-        mask = Path(vs).contains_points(pts).reshape(H, W)
-        idx = np.flatnonzero(mask)
+        # 外接矩形内だけを判定（キャッシュ共有）
+        idx = self._get_polygon_idx(pg, d)
         
         if idx.size == 0:
             return None, None, None, 0
         
-        D = d.reshape(-1, B)[idx].astype(float, copy=False)
-        m = np.nanmean(D, axis=0)
-        s = np.nanstd(D, axis=0, ddof=0)
+        if HAS_NUMBA:
+            # 平均・標準偏差を1パスで（Welford）
+            m, s = _mean_std_nan(d, np.ascontiguousarray(idx, dtype=np.int64))
+        else:
+            D = _gather_pixels(d, idx).astype(float, copy=False)
+            m = np.nanmean(D, axis=0)
+            s = np.nanstd(D, axis=0, ddof=0)
         
         return np.asarray(wl).astype(float), m, s, idx.size
 
-    @staticmethod
-    def _safe_float(v: Any) -> float:
-        """Safely convert to float."""
-        try:
-            return float(v)
-        except Exception:
-            return float("nan")
-
     def _write_csv_new(self, path: str, wl: np.ndarray, ids: List[str], M: np.ndarray,
                        note_recomputed: bool = False,
                        labels_list: Optional[List[str]] = None,
@@ -3050,8 +4000,13 @@ class HyperspecTk(tk.Tk):
             w = csv.writer(f)
             w.writerow(["wavelength_nm", *ids])
             
-            for i in range(len(wl)):
-                w.writerow([float(wl[i]), *[self._safe_float(M[i, j]) for j in range(M.shape[1])]])
+            if len(wl) == 0:
+                return  # 波長なし → ヘッダのみ
+            
+            # 数値ブロックは一括で Python float 化して書き出す（セル単位の変換を避ける）
+            block = np.column_stack([np.asarray(wl, dtype=float).reshape(-1, 1),
+                                     np.asarray(M, dtype=float).reshape(len(wl), -1)])
+            w.writerows(block.tolist())
 
     def on_save_meta_only(self) -> None:
         """Save metadata JSON only."""
@@ -3167,28 +4122,36 @@ class HyperspecTk(tk.Tk):
         try:
             active = self.nb.index(self.nb.select())
             
+            # Save Gray / RGB image with unified size
             if active == 0:
-                # Save Gray image with unified size
-                img_path = base
-                original_size = self.gray_fig.get_size_inches()
-                original_pos = self.ax_gray.get_position()
-                self.gray_fig.set_size_inches(SAVE_FIGSIZE_IMAGE)
-                self.gray_fig.tight_layout()  # Optimize internal layout
-                self.gray_fig.savefig(img_path, dpi=SAVE_DPI)
-                self.gray_fig.set_size_inches(original_size)
-                self.ax_gray.set_position(original_pos)
-                self.gray_canvas.draw_idle()
+                fig, ax, canvas = self.gray_fig, self.ax_gray, self.gray_canvas
             else:
-                # Save RGB image with unified size
-                img_path = base
-                original_size = self.rgb_fig.get_size_inches()
-                original_pos = self.ax_rgb.get_position()
-                self.rgb_fig.set_size_inches(SAVE_FIGSIZE_IMAGE)
-                self.rgb_fig.tight_layout()  # Optimize internal layout
-                self.rgb_fig.savefig(img_path, dpi=SAVE_DPI)
-                self.rgb_fig.set_size_inches(original_size)
-                self.ax_rgb.set_position(original_pos)
-                self.rgb_canvas.draw_idle()
+                fig, ax, canvas = self.rgb_fig, self.ax_rgb, self.rgb_canvas
+            img_path = base
+            
+            # 前回の保存から画像ビューが変わっておらず、ファイルもそのままなら描き直さない
+            sig = self._image_png_signature(ax)
+            last = self._last_png.get(ax)
+            try:
+                up_to_date = (last is not None and last[0] == sig and last[1] == os.path.abspath(img_path)
+                              and last[2] == os.stat(img_path).st_mtime_ns)
+            except OSError:
+                up_to_date = False
+            
+            if not up_to_date:
+                original_size = fig.get_size_inches()
+                original_pos = ax.get_position()
+                fig.set_size_inches(SAVE_FIGSIZE_IMAGE)
+                fig.tight_layout()  # Optimize internal layout
+                self._set_overlay_static(ax, True)
+                try:
+                    fig.savefig(img_path, dpi=SAVE_DPI)
+                finally:
+                    self._set_overlay_static(ax, False)
+                fig.set_size_inches(original_size)
+                ax.set_position(original_pos)
+                canvas.draw_idle()
+                self._last_png[ax] = (sig, os.path.abspath(img_path), os.stat(img_path).st_mtime_ns)
             
             # Save spectra with unified size
             spec_path = os.path.splitext(base)[0] + "_spectra.png"
@@ -3212,7 +4175,7 @@ class HyperspecTk(tk.Tk):
         """Load metadata from JSON file."""
         skipped_points = 0
         skipped_polygons = 0
-        missing_sources = set()
+        missing_sources: Dict[str, str] = {}  # source path -> basename
         
         path = filedialog.askopenfilename(
             title="Load meta JSON",
@@ -3223,11 +4186,20 @@ class HyperspecTk(tk.Tk):
             return
         
         # Show loading status
-        self._set_status("Loading meta JSON...")
+        self._set_status("Loading meta JSON...", flush=True)
         
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                meta = json.load(f)
+            if HAS_ORJSON:
+                with open(path, "rb") as f:
+                    raw = f.read()
+                try:
+                    meta = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # NaN / Infinity など orjson が受け付けない表記は標準 json で読む
+                    meta = json.loads(raw.decode("utf-8"))
+            else:
+                with open(path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
         except Exception as e:
             self._clear_status()
             messagebox.showerror("Load meta JSON", f"Failed to read JSON: {e}")
@@ -3246,12 +4218,11 @@ class HyperspecTk(tk.Tk):
         hdr_candidates: List[str] = []
         
         # Get existing point/polygon maps
-        pt_exact, pt_by_xy = self._existing_point_maps()
-        pg_exact, pg_by_shape = self._existing_poly_maps()
+        pt_exact, pt_by_xy, pt_by_xy_ref = self._existing_point_maps()
+        pg_exact, pg_by_shape, pg_by_shape_ref = self._existing_poly_maps()
         
         # Track items in current JSON to avoid self-duplicates
-        seen_pts_in_meta = set()
-        seen_polys_in_meta = set()
+        # （pt_exact / pg_exact はこの呼び出し専用の set なので、そのまま追加して in 1回で判定）
 
         def _coerce_xy(v):
             try:
@@ -3259,6 +4230,46 @@ class HyperspecTk(tk.Tk):
             except Exception:
                 return None
 
+        # パス解決のメモ（多数のエントリが少数のソースを共有するので、stat は一意なパスごとに1回）
+        _isfile = lru_cache(maxsize=None)(os.path.isfile)
+
+        @lru_cache(maxsize=None)
+        def _dir_files(d: str):
+            # scandir の DirEntry.is_file() でフォルダ内のファイル名を一度に取得（失敗時は None）
+            try:
+                with os.scandir(d) as it:
+                    return frozenset(os.path.normcase(e.name) for e in it if e.is_file())
+            except OSError:
+                return None
+
+        def _in_dir(d: str, base: str) -> bool:
+            names = _dir_files(d)
+            if names is None:
+                return _isfile(os.path.join(d, base))
+            return os.path.normcase(base) in names
+
+        def _resolve_src_path(spath: Any, search_parent: bool) -> str:
+            return _resolve_cached(str(spath), search_parent) if spath else ""
+
+        @lru_cache(maxsize=None)
+        def _resolve_cached(sp: str, search_parent: bool) -> str:
+            if not os.path.isabs(sp):
+                cand = os.path.join(json_dir, sp)
+                if _isfile(cand):
+                    sp = cand
+            
+            if not _isfile(sp) and sp.lower().endswith(".hdr"):
+                base = os.path.basename(sp)
+                # JSON と同じフォルダ / 親フォルダは scandir の結果で判定
+                if _in_dir(json_dir, base):
+                    sp = os.path.join(json_dir, base)
+                elif search_parent:
+                    parent = os.path.dirname(json_dir)
+                    if _in_dir(parent, base):
+                        sp = os.path.join(parent, base)
+            
+            return sp
+
         # Load points
         for sid, info in items:
             if not isinstance(info, dict):
@@ -3286,42 +4297,32 @@ class HyperspecTk(tk.Tk):
                 continue
 
             if src_path:
-                sp = str(src_path)
-                if not os.path.isabs(sp):
-                    cand = os.path.join(json_dir, sp)
-                    if os.path.isfile(cand):
-                        sp = cand
-                
-                if not os.path.isfile(sp) and sp.lower().endswith(".hdr"):
-                    cand = os.path.join(json_dir, os.path.basename(sp))
-                    if os.path.isfile(cand):
-                        sp = cand
-                
-                src_path = sp
+                src_path = _resolve_src_path(src_path, search_parent=False)
 
             label = info.get("label") or info.get("name") or info.get("id") or sid
             src_path = str(src_path) if src_path is not None else ""
             visible = bool(info.get("visible", True))
 
-            if src_path and src_path.lower().endswith(".hdr") and os.path.isfile(src_path):
+            # .hdr 判定と存在確認はエントリごとに1回
+            is_hdr = src_path.lower().endswith(".hdr")
+            src_ok = is_hdr and _isfile(src_path)
+            if src_ok:
                 hdr_candidates.append(src_path)
 
             # Check for duplicates
-            label = str(label)
+            if not isinstance(label, str):
+                label = str(label)
             kxy = self._point_key(src_path, x, y)
             k_exact = (kxy, label)
             
-            if (k_exact in pt_exact) or (k_exact in seen_pts_in_meta):
+            if k_exact in pt_exact:
                 skipped_points += 1
             else:
-                if (kxy in pt_by_xy) or (kxy in {k for (k, _) in pt_exact}):
-                    current_lbl = pt_by_xy.get(kxy, "")
-                    for p0 in self.points:
-                        if self._point_key(p0.get("source", ""), p0.get("x", 0), p0.get("y", 0)) == kxy:
-                            if (not current_lbl) and label:
-                                p0["label"] = label
-                            p0["visible"] = visible
-                            break
+                p0 = pt_by_xy_ref.get(kxy)
+                if p0 is not None:
+                    if (not pt_by_xy[kxy]) and label:
+                        p0["label"] = label
+                    p0["visible"] = visible
                     skipped_points += 1
                 else:
                     pending_points.append({
@@ -3329,11 +4330,10 @@ class HyperspecTk(tk.Tk):
                         "label": label, "source": src_path,
                         "visible": visible,
                     })
-                    seen_pts_in_meta.add(k_exact)
-                    seen_pts_in_meta.add(kxy)
+                    pt_exact.add(k_exact)
             
-            if src_path and src_path.lower().endswith(".hdr") and (not os.path.isfile(src_path)):
-                missing_sources.add(os.path.basename(str(src_path)))
+            if is_hdr and not src_ok and src_path not in missing_sources:
+                missing_sources[src_path] = os.path.basename(src_path)
 
         # Load processing settings
         proc = meta.get("processing", {})
@@ -3359,29 +4359,6 @@ class HyperspecTk(tk.Tk):
         polys_meta = meta.get("polygons", [])
         polys_iter = polys_meta.values() if isinstance(polys_meta, dict) else polys_meta
 
-        def _resolve_src_path(spath: str) -> str:
-            if not spath:
-                return ""
-            
-            sp = str(spath)
-            if not os.path.isabs(sp):
-                cand = os.path.join(json_dir, sp)
-                if os.path.isfile(cand):
-                    sp = cand
-            
-            if not os.path.isfile(sp) and sp.lower().endswith(".hdr"):
-                base = os.path.basename(sp)
-                cand1 = os.path.join(json_dir, base)
-                if os.path.isfile(cand1):
-                    return cand1
-                
-                parent = os.path.dirname(json_dir)
-                cand2 = os.path.join(parent, base)
-                if os.path.isfile(cand2):
-                    return cand2
-            
-            return sp
-
         loaded_polys = 0
         for item in polys_iter:
             if not isinstance(item, dict):
@@ -3402,44 +4379,44 @@ class HyperspecTk(tk.Tk):
                 if isinstance(sdict, dict):
                     src_path = sdict.get("path_full") or sdict.get("path") or sdict.get("path_basename")
             
-            src_path = _resolve_src_path(src_path) if src_path else ""
+            src_path = _resolve_src_path(src_path, search_parent=True)
             
-            if src_path and src_path.lower().endswith(".hdr") and os.path.isfile(src_path):
+            is_hdr = src_path.lower().endswith(".hdr")
+            src_ok = is_hdr and _isfile(src_path)
+            if src_ok:
                 hdr_candidates.append(src_path)
 
             label = item.get("label") or item.get("id") or ""
+            if not isinstance(label, str):
+                label = str(label)
             visible = bool(item.get("visible", True))
             
             # Check for duplicates
             canon = self._canon_poly(vs)
             kshape = (self._norm_src(src_path or self.path_var.get()), canon)
-            k_exact = (kshape, str(label))
+            k_exact = (kshape, label)
             
-            if (k_exact in pg_exact) or (k_exact in seen_polys_in_meta):
+            if k_exact in pg_exact:
                 skipped_polygons += 1
             else:
-                if (kshape in pg_by_shape) or (kshape in {k for (k, _) in pg_exact}):
-                    current_lbl = pg_by_shape.get(kshape, "")
-                    for pg in self.polygons:
-                        if self._poly_key(pg.get("source", ""), pg.get("verts") or []) == kshape:
-                            if (not current_lbl) and label:
-                                pg["label"] = str(label)
-                            pg["visible"] = visible
-                            break
+                pg0 = pg_by_shape_ref.get(kshape)
+                if pg0 is not None:
+                    if (not pg_by_shape[kshape]) and label:
+                        pg0["label"] = label
+                    pg0["visible"] = visible
                     skipped_polygons += 1
                 else:
                     pending_polygons.append({
                         "verts": vs, "color": None,
-                        "label": str(label), "source": src_path or self.path_var.get(),
+                        "label": label, "source": src_path or self.path_var.get(),
                         "visible": visible,
                     })
-                    seen_polys_in_meta.add(k_exact)
-                    seen_polys_in_meta.add(kshape)
+                    pg_exact.add(k_exact)
             
             loaded_polys += 1
             
-            if src_path and src_path.lower().endswith(".hdr") and (not os.path.isfile(src_path)):
-                missing_sources.add(os.path.basename(str(src_path)))
+            if is_hdr and not src_ok and src_path not in missing_sources:
+                missing_sources[src_path] = os.path.basename(src_path)
 
         # Auto-load HDR if none loaded
         if self.data is None and hdr_candidates:
@@ -3458,13 +4435,13 @@ class HyperspecTk(tk.Tk):
             self.polygons.extend(pending_polygons)
         
         # Reassign colors
-        for i, p in enumerate(self.points):
-            p["color"] = self._palette10[i % 10]
-        for j, pg in enumerate(self.polygons):
-            pg["color"] = self._palette10[j % 10]
+        for p, c in zip(self.points, itertools.cycle(self._palette10)):
+            p["color"] = c
+        for pg, c in zip(self.polygons, itertools.cycle(self._palette10)):
+            pg["color"] = c
+        self._items_changed()
         
-        self._pt_color_idx = len(self.points) % 10
-        self._pg_color_idx = len(self.polygons) % 10
+        self._reset_color_cycles(len(self.points), len(self.polygons))
 
         # ★ Load plot range (X-axis) BEFORE redraw
         pr = meta.get("plot_range", {})
@@ -3516,15 +4493,9 @@ class HyperspecTk(tk.Tk):
             self._update_plot_y_range_label()
             y_range_loaded = True
 
-        # ★ Redraw spectra (this applies both X and Y ranges)
-        self._redraw_spec_lines(show_status=False)
-        
-        # Update images
-        if self.data is not None:
-            self._update_gray_image()
-            self._update_rgb_image()
-        
-        self._refresh_points_view()
+        # ★ Redraw spectra (this applies both X and Y ranges), images and tree
+        # 再描画は次の idle にまとめる（連続ロードでも1回だけ、ロード結果のステータスは上書きしない）
+        self._request_update("tree", "spec", "gray", "rgb", quiet=True)
 
         # Build message
         lines = []
@@ -3552,7 +4523,7 @@ class HyperspecTk(tk.Tk):
         if missing_sources:
             lines.append("")
             lines.append("Missing HDR:")
-            listed = sorted(missing_sources)
+            listed = sorted(set(missing_sources.values()))
             show = listed[:5]
             for f in show:
                 lines.append(f" - {f}")
@@ -3580,6 +4551,33 @@ class HyperspecTk(tk.Tk):
     # =========================================================================
     # HELPER METHODS
     # =========================================================================
+    def _request_update(self, *parts: str, quiet: bool = False) -> None:
+        """
+        Mark views dirty ("tree", "spec", "gray", "rgb", "overlay") and flush them
+        once on the next idle (bursts of edits are coalesced).
+        
+        quiet=True redraws spectra without the progress status, unless another
+        request in the same burst asked for it.
+        """
+        self._dirty_views.update(parts)
+        if not quiet:
+            self._update_show_status = True
+        if self._update_after_id is None:
+            self._update_after_id = self.after_idle(self._flush_updates)
+
+    def _flush_updates(self) -> None:
+        """Run each pending view update at most once."""
+        self._update_after_id = None
+        dirty, self._dirty_views = self._dirty_views, set()
+        show_status, self._update_show_status = self._update_show_status, False
+        if "tree" in dirty:
+            self._refresh_points_view()
+        if "spec" in dirty:
+            self._redraw_spec_lines(show_status=show_status)
+        self._request_image_update(*(v for v in ("gray", "rgb") if v in dirty))
+        if "overlay" in dirty and self._active_image_view() not in dirty:
+            self._update_overlays()
+
     def _debounce(self, key: str, func, delay_ms: int = 1) -> None:
         """Debounce function call."""
         if not hasattr(self, "_debouncers"):
@@ -3634,10 +4632,8 @@ class HyperspecTk(tk.Tk):
         except Exception:
             return False
         
-        def _is01(t):
-            return (abs(t[0] - 0.0) < 1e-9) and (abs(t[1] - 1.0) < 1e-9)
-        
-        if _is01(xl) and _is01(yl):
+        # matplotlib の初期範囲はちょうど (0.0, 1.0)
+        if xl == (0.0, 1.0) and yl == (0.0, 1.0):
             return False
         
         w = abs(xl[1] - xl[0])
@@ -3659,26 +4655,50 @@ class HyperspecTk(tk.Tk):
     def _norm_path(self, p: Any) -> str:
         """Normalize path for comparison."""
         try:
-            return os.path.normcase(os.path.normpath(os.path.abspath(str(p))))
+            return _normalize_path(str(p))
         except Exception:
             return str(p) if p is not None else ""
 
+    def _src_id(self, sp: Any) -> int:
+        """Integer id of a (normalized) source path, for vectorized comparison."""
+        key = self._norm_path(sp)
+        sid = self._src_id_map.get(key)
+        if sid is None:
+            sid = self._src_id_map[key] = len(self._src_id_map)
+        return sid
+
+    def _items_changed(self) -> None:
+        """Mark the SoA mirrors of points/polygons stale."""
+        self._pt_store.mark_dirty()
+        self._pg_store.mark_dirty()
+
     def _same_source(self, a: Any, b: Any) -> bool:
         """Check if two sources are the same."""
-        return self._norm_path(a) == self._norm_path(b)
+        if a is b:
+            return True
+        na, nb = self._norm_path(a), self._norm_path(b)
+        return na is nb or na == nb
 
     def _source_exists(self, sp: str) -> bool:
-        """Check if source file exists."""
+        """Check if source file exists (result reused for SOURCE_EXISTS_TTL_S)."""
+        sp = str(sp or "")
+        if not sp:
+            return False
+        now = time.monotonic()
+        c = self._src_exists_cache.get(sp)
+        if c is not None and now - c[1] < SOURCE_EXISTS_TTL_S:
+            return c[0]
         try:
-            sp = str(sp or "")
-            return bool(sp and os.path.isfile(sp) and sp.lower().endswith(".hdr"))
+            ok = bool(sp.lower().endswith(".hdr") and os.path.isfile(sp))
         except Exception:
-            return False
+            ok = False
+        self._src_exists_cache[sp] = (ok, now)
+        return ok
 
     def _norm_src(self, sp: str) -> str:
         """Normalize source path."""
         try:
-            return os.path.normcase(os.path.normpath(os.path.abspath(str(sp or ""))))
+            return _normalize_path(str(sp or ""))
         except Exception:
             return str(sp or "")
 
@@ -3688,28 +4708,17 @@ class HyperspecTk(tk.Tk):
 
     def _canon_poly(self, verts) -> tuple:
         """Canonicalize polygon vertices for comparison."""
-        V = tuple((int(x), int(y)) for x, y in (verts or []))
-        if len(V) < 3:
-            return V
-        
-        rotations = [V[i:] + V[:i] for i in range(len(V))]
-        rev = V[::-1]
-        rotations += [rev[i:] + rev[:i] for i in range(len(rev))]
-        
-        return min(rotations)
-
-    def _poly_key(self, src: str, verts) -> tuple:
-        """Generate cache key for polygon."""
-        return (self._norm_src(src), self._canon_poly(verts))
+        return _canon_verts(tuple((int(x), int(y)) for x, y in (verts or [])))
 
     def _normalize_verts(self, verts: Sequence[Tuple[int, int]]) -> Tuple[Tuple[int, int], ...]:
         """Normalize vertex list."""
         return tuple((int(x), int(y)) for (x, y) in verts or [])
 
     def _existing_point_maps(self):
-        """Get existing point maps for duplicate detection."""
+        """Get existing point maps for duplicate detection (exact, key -> label, key -> first point)."""
         exact = set()
         by_xy = dict()
+        by_xy_ref = dict()
         
         for p in self.points:
             src = p.get("source", "")
@@ -3717,23 +4726,25 @@ class HyperspecTk(tk.Tk):
             lbl = str(p.get("label", ""))
             exact.add((kxy, lbl))
             by_xy[kxy] = lbl
+            by_xy_ref.setdefault(kxy, p)
         
-        return exact, by_xy
+        return exact, by_xy, by_xy_ref
 
     def _existing_poly_maps(self):
-        """Get existing polygon maps for duplicate detection."""
+        """Get existing polygon maps for duplicate detection (exact, key -> label, key -> first polygon)."""
         exact = set()
         by_shape = dict()
+        by_shape_ref = dict()
         
         for pg in self.polygons:
-            src = pg.get("source", "")
-            verts = pg.get("verts") or []
-            k = self._poly_key(src, verts)
+            # 正規化した頂点列は verts ごとにキャッシュ（ソースの正規化は lru_cache 済み）
+            k = (self._norm_src(pg.get("source", "")), self._poly_cached(pg, "_canon", self._canon_poly))
             lbl = str(pg.get("label", ""))
             exact.add((k, lbl))
             by_shape[k] = lbl
+            by_shape_ref.setdefault(k, pg)
         
-        return exact, by_shape
+        return exact, by_shape, by_shape_ref
 
     def _toolbar_busy(self, ax) -> bool:
         """Check if toolbar is in pan/zoom mode."""
@@ -3766,21 +4777,17 @@ class HyperspecTk(tk.Tk):
     def _toggle_all_visibility(self) -> None:
         """Toggle visibility of all points/polygons."""
         # Check if any item is currently hidden
-        any_hidden = any(not p.get("visible", True) for p in self.points)
-        any_hidden = any_hidden or any(not pg.get("visible", True) for pg in self.polygons)
+        any_hidden = any(not it.get("visible", True)
+                         for it in itertools.chain(self.points, self.polygons))
         
         # If any hidden, show all; otherwise hide all
         new_state = any_hidden
         
-        for p in self.points:
-            p["visible"] = new_state
-        for pg in self.polygons:
-            pg["visible"] = new_state
+        for it in itertools.chain(self.points, self.polygons):
+            it["visible"] = new_state
+        self._items_changed()
         
-        self._refresh_points_view()
-        self._redraw_spec_lines()
-        self._update_gray_image()
-        self._update_rgb_image()
+        self._request_update("tree", "spec", "overlay")
         
         # Show status
         status_msg = "All items shown" if new_state else "All items hidden"
@@ -3800,21 +4807,13 @@ class HyperspecTk(tk.Tk):
     def _cancel_current_ui(self) -> None:
         """Cancel current UI operations."""
         # Close inline editor
-        e = getattr(self, "_tv_inline_entry", None)
-        if e is not None:
-            try:
-                e.destroy()
-            except Exception:
-                pass
-            self._tv_inline_entry = None
-            self._tv_inline_iid = None
+        self._cancel_inline_edit()
 
         # Cancel polygon drawing
         if self.poly_mode.get() and self._poly_temp_verts:
             self._poly_temp_verts = []
             self._poly_drawing_axes = None
-            self._update_gray_image()
-            self._update_rgb_image()
+            self._update_overlays()
 
         # Close toplevel windows
         for w in self.winfo_children():
@@ -3826,10 +4825,8 @@ class HyperspecTk(tk.Tk):
 
     def _toggle_fullscreen(self) -> None:
         """Toggle fullscreen mode."""
-        is_windows = platform.system() == "Windows"
-        
         if not self._is_full:
-            if is_windows:
+            if IS_WINDOWS:
                 try:
                     self._normal_geometry = self.geometry()
                     self.state('zoomed')
@@ -3840,7 +4837,7 @@ class HyperspecTk(tk.Tk):
                 self.attributes("-fullscreen", True)
             self._is_full = True
         else:
-            if is_windows:
+            if IS_WINDOWS:
                 try:
                     self.state('normal')
                     if hasattr(self, "_normal_geometry"):
@@ -3856,16 +4853,18 @@ class HyperspecTk(tk.Tk):
     # =========================================================================
     # STATUS MESSAGE MANAGEMENT
     # =========================================================================
-    def _set_status(self, message: str, duration_ms: int = 0) -> None:
+    def _set_status(self, message: str, duration_ms: int = 0, flush: bool = False) -> None:
         """
         Set status message.
         
         Args:
             message: Status message to display
             duration_ms: Duration in milliseconds (0 = permanent until changed)
+            flush: Repaint immediately (for progress messages shown before blocking work)
         """
         self.status_var.set(message)
-        self.update_idletasks()  # Force immediate UI update
+        if flush:
+            self.update_idletasks()  # Force immediate UI update
         
         # Cancel previous auto-clear timer
         if self._status_after_id is not None:
@@ -3877,7 +4876,7 @@ class HyperspecTk(tk.Tk):
         
         # Set auto-clear timer if duration specified
         if duration_ms > 0:
-            self._status_after_id = self.after(duration_ms, lambda: self._set_status("Ready"))
+            self._status_after_id = self.after(duration_ms, self._clear_status)
     
     def _clear_status(self) -> None:
         """Clear status message (set to Ready)."""